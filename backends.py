@@ -0,0 +1,148 @@
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+BACKENDS = ("solutions", "tasks_video", "tasks_live")
+# MediaPipe runs TFLite models on the CPU through XNNPACK
+DELEGATES = ("xnnpack", "gpu")
+
+DEFAULT_OPTIONS = {
+    "model_complexity": 1,
+    "max_num_hands": 2,
+    "min_detection_confidence": 0.5,
+    "min_tracking_confidence": 0.5,
+    "model_path": "models/hand_landmarker.task",
+    "delegate": "xnnpack"
+}
+
+def empty_results():
+    return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+
+def tasks_to_results(result):
+    # same shape as the solutions output, so tracking, the governor and the games work with either
+    if result is None or not result.hand_landmarks:
+        return empty_results()
+    return SimpleNamespace(
+        multi_hand_landmarks=[SimpleNamespace(landmark=hand) for hand in result.hand_landmarks],
+        multi_handedness=[SimpleNamespace(classification=[SimpleNamespace(label=categories[0].category_name,
+                                                                          score=categories[0].score)])
+                          for categories in result.handedness]
+    )
+
+
+class SolutionsBackend:
+    name = "solutions"
+
+    def __init__(self, options, static_image_mode=False, max_num_hands=None):
+        import mediapipe as mp
+        self.hands = mp.solutions.hands.Hands(
+            static_image_mode=static_image_mode,
+            max_num_hands=max_num_hands or options["max_num_hands"],
+            model_complexity=options["model_complexity"],
+            min_detection_confidence=options["min_detection_confidence"],
+            min_tracking_confidence=options["min_tracking_confidence"]
+        )
+
+    def describe(self):
+        return "solutions.hands (CPU)"
+
+    def process(self, rgb_frame):
+        return self.hands.process(rgb_frame)
+
+    def close(self):
+        self.hands.close()
+
+
+class TasksBackend:
+    def __init__(self, options, running_mode="video", max_num_hands=None):
+        import mediapipe as mp
+        from mediapipe.tasks.python import BaseOptions, vision
+
+        if not os.path.exists(options["model_path"]):
+            raise FileNotFoundError(f"HandLandmarker model not found at {options['model_path']}")
+        self._mp = mp
+        self.name = "tasks_" + running_mode
+        self.running_mode = running_mode
+        self.delegate = options["delegate"]
+        delegate = BaseOptions.Delegate.GPU if self.delegate == "gpu" else BaseOptions.Delegate.CPU
+        modes = {
+            "image": vision.RunningMode.IMAGE,
+            "video": vision.RunningMode.VIDEO,
+            "live_stream": vision.RunningMode.LIVE_STREAM
+        }
+        landmarker_options = vision.HandLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=options["model_path"], delegate=delegate),
+            running_mode=modes[running_mode],
+            num_hands=max_num_hands or options["max_num_hands"],
+            min_hand_detection_confidence=options["min_detection_confidence"],
+            min_hand_presence_confidence=options["min_detection_confidence"],
+            min_tracking_confidence=options["min_tracking_confidence"],
+            result_callback=self._on_result if running_mode == "live_stream" else None
+        )
+        self.landmarker = vision.HandLandmarker.create_from_options(landmarker_options)
+        self._last_timestamp = -1
+        self._lock = threading.Lock()
+        self._latest = empty_results()
+        self.submitted = 0
+        self.completed = 0
+
+    def describe(self):
+        return f"HandLandmarker {self.running_mode} ({self.delegate})"
+
+    def _timestamp(self):
+        # VIDEO and LIVE_STREAM modes reject timestamps that don't increase
+        timestamp = max(int(time.perf_counter() * 1000), self._last_timestamp + 1)
+        self._last_timestamp = timestamp
+        return timestamp
+
+    def _on_result(self, result, output_image, timestamp_ms):
+        results = tasks_to_results(result)
+        with self._lock:
+            self._latest = results
+            self.completed += 1
+
+    def process(self, rgb_frame):
+        image = self._mp.Image(image_format=self._mp.ImageFormat.SRGB, data=np.ascontiguousarray(rgb_frame))
+        if self.running_mode == "image":
+            return tasks_to_results(self.landmarker.detect(image))
+        if self.running_mode == "video":
+            return tasks_to_results(self.landmarker.detect_for_video(image, self._timestamp()))
+        # live stream: hand the frame over and return the newest finished result, usually a frame behind
+        self.landmarker.detect_async(image, self._timestamp())
+        self.submitted += 1
+        with self._lock:
+            return self._latest
+
+    def close(self):
+        self.landmarker.close()
+
+
+def create_backend(name, options, static_image_mode=False, max_num_hands=None):
+    if name == "solutions":
+        return SolutionsBackend(options, static_image_mode=static_image_mode, max_num_hands=max_num_hands)
+    if name in ("tasks_video", "tasks_live"):
+        running_mode = "image" if static_image_mode else ("video" if name == "tasks_video" else "live_stream")
+        return TasksBackend(options, running_mode=running_mode, max_num_hands=max_num_hands)
+    raise ValueError(f"Unknown inference backend {name!r}, expected one of {', '.join(BACKENDS)}")
+
+def open_backend(name, options, static_image_mode=False, max_num_hands=None):
+    # tries the configured backend and delegate, falling back until something runs on this machine
+    attempts = []
+    if name != "solutions":
+        attempts.append((name, options["delegate"]))
+        if options["delegate"] == "gpu":
+            attempts.append((name, "xnnpack"))
+    attempts.append(("solutions", "xnnpack"))
+    error = None
+    for backend_name, delegate in attempts:
+        try:
+            return create_backend(backend_name, dict(options, delegate=delegate),
+                                  static_image_mode=static_image_mode, max_num_hands=max_num_hands)
+        except Exception as e:
+            label = backend_name if backend_name == "solutions" else f"{backend_name} ({delegate})"
+            print(f"[WARNING] Inference backend {label} unavailable: {e}")
+            error = e
+    raise error
@@ -0,0 +1,229 @@
+import argparse
+import csv
+import glob
+import json
+import multiprocessing
+import os
+import time
+
+import cv2
+import numpy as np
+
+from landmarks import NUM_LANDMARKS, results_to_arrays, finger_states_batch
+from backends import BACKENDS, open_backend
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".webp")
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv", ".webm", ".m4v")
+OUTPUT_FORMATS = ("jsonl", "csv", "npz")
+
+_worker_hands = {}
+_worker_options = {}
+
+def init_worker(options):
+    _worker_options.update(options)
+
+def open_worker_hands(static_image_mode):
+    # every frame needs its own result, so live stream mode runs as video mode here
+    backend = _worker_options["backend"]
+    if backend == "tasks_live":
+        backend = "tasks_video"
+    return open_backend(backend, _worker_options["inference"], static_image_mode=static_image_mode)
+
+def get_image_hands():
+    # static image mode keeps nothing between images, so one detector serves every image task of the worker
+    if "images" not in _worker_hands:
+        _worker_hands["images"] = open_worker_hands(True)
+    return _worker_hands["images"]
+
+def detect(hands, frame):
+    # same path as the live app: detect on the unflipped frame, results_to_arrays mirrors the landmarks
+    size = _worker_options.get("size")
+    if size:
+        frame = cv2.resize(frame, size)
+    results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    landmarks, is_right = results_to_arrays(results)
+    return landmarks, is_right, finger_states_batch(landmarks, is_right)
+
+def process_task(task):
+    start = time.perf_counter()
+    records = []
+
+    if task["kind"] == "video":
+        # a fresh tracking detector per shard, so no hand state leaks in from whatever shard the worker ran before
+        hands = open_worker_hands(False)
+        cap = cv2.VideoCapture(task["source"])
+        try:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, task["start"])
+            frame_index = task["start"]
+            while frame_index < task["end"]:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                records.append((task["source"], frame_index) + detect(hands, frame))
+                frame_index += 1
+        finally:
+            cap.release()
+            hands.close()
+    else:
+        hands = get_image_hands()
+        for path in task["paths"]:
+            frame = cv2.imread(path)
+            if frame is None:
+                print(f"[WARNING] Could not read image {path}")
+                continue
+            records.append((path, 0) + detect(hands, frame))
+
+    stats = {"pid": os.getpid(), "frames": len(records), "seconds": time.perf_counter() - start}
+    return records, stats
+
+def expand_inputs(inputs):
+    videos = []
+    images = []
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            paths = sorted(glob.glob(os.path.join(pattern, "*")))
+        elif glob.has_magic(pattern):
+            paths = sorted(glob.glob(pattern, recursive=True))
+        else:
+            paths = [pattern]
+
+        for path in paths:
+            extension = os.path.splitext(path)[1].lower()
+            if extension in VIDEO_EXTENSIONS:
+                videos.append(path)
+            elif extension in IMAGE_EXTENSIONS:
+                images.append(path)
+            elif not os.path.isdir(pattern):
+                print(f"[WARNING] Skipping unsupported input {path}")
+    return list(dict.fromkeys(videos)), list(dict.fromkeys(images))
+
+def parse_range(text):
+    if not text:
+        return 0, None
+    start, _, end = text.partition(":")
+    return int(start or 0), int(end) if end else None
+
+def build_tasks(videos, images, shard_size, frame_range=(0, None)):
+    tasks = []
+    range_start, range_end = frame_range
+    for path in videos:
+        cap = cv2.VideoCapture(path)
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        cap.release()
+        if frame_count <= 0:
+            print(f"[WARNING] Could not read frame count of {path}, processing it as one shard")
+            end = range_end if range_end is not None else float("inf")
+            tasks.append({"kind": "video", "source": path, "start": range_start, "end": end})
+            continue
+        end = min(frame_count, range_end) if range_end is not None else frame_count
+        for start in range(range_start, end, shard_size):
+            tasks.append({"kind": "video", "source": path, "start": start, "end": min(start + shard_size, end)})
+
+    for i in range(0, len(images), shard_size):
+        tasks.append({"kind": "images", "paths": images[i:i + shard_size]})
+    return tasks
+
+def write_jsonl(records, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        for source, frame_index, landmarks, is_right, finger_states in records:
+            hands = [{
+                "handedness": "right" if is_right[i] else "left",
+                "fingers": int(finger_states[i].sum()),
+                "finger_states": finger_states[i].tolist(),
+                "landmarks": landmarks[i].tolist()
+            } for i in range(len(landmarks))]
+            f.write(json.dumps({"source": source, "frame": frame_index, "hands": hands}) + "\n")
+
+def write_csv(records, path):
+    landmark_columns = [f"{axis}{i}" for i in range(NUM_LANDMARKS) for axis in "xyz"]
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["source", "frame", "hand", "handedness", "fingers"] + landmark_columns)
+        for source, frame_index, landmarks, is_right, finger_states in records:
+            if len(landmarks) == 0:
+                writer.writerow([source, frame_index, "", "", 0])
+            for i in range(len(landmarks)):
+                writer.writerow([source, frame_index, i, "right" if is_right[i] else "left",
+                                 int(finger_states[i].sum())] + landmarks[i].ravel().tolist())
+
+def write_npz(records, path):
+    sources = sorted({record[0] for record in records})
+    source_ids = {source: i for i, source in enumerate(sources)}
+    hand_counts = np.array([len(record[2]) for record in records], dtype=np.int32)
+    np.savez_compressed(
+        path,
+        sources=np.array(sources),
+        frame_source=np.array([source_ids[record[0]] for record in records], dtype=np.int32),
+        frame_index=np.array([record[1] for record in records], dtype=np.int64),
+        hand_count=hand_counts,
+        hand_frame=np.repeat(np.arange(len(records), dtype=np.int32), hand_counts),
+        is_right=np.concatenate([record[3] for record in records]) if records else np.zeros(0, dtype=bool),
+        finger_states=np.concatenate([record[4] for record in records]) if records else np.zeros((0, 5), dtype=bool),
+        landmarks=np.concatenate([record[2] for record in records]) if records else np.zeros((0, NUM_LANDMARKS, 3), dtype=np.float32)
+    )
+
+WRITERS = {"jsonl": write_jsonl, "csv": write_csv, "npz": write_npz}
+
+def main():
+    parser = argparse.ArgumentParser(description="Run hand detection offline over video files and image folders")
+    parser.add_argument("inputs", nargs="+", help="video files, image directories or glob patterns")
+    parser.add_argument("-o", "--output", required=True, help="output file (.jsonl, .csv or .npz)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, help="output format, defaults to the output file extension")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--shard-size", type=int, default=300, help="frames (or images) per task")
+    parser.add_argument("--range", dest="frame_range", help="frame range START:END to process in every video")
+    parser.add_argument("--width", type=int, help="resize frames to this width before detection")
+    parser.add_argument("--height", type=int, help="resize frames to this height before detection")
+    parser.add_argument("--max-hands", type=int, help="most hands per frame, defaults to the inference section of config.json")
+    parser.add_argument("--backend", choices=BACKENDS, help="hand detection backend, defaults to the inference section of config.json")
+    args = parser.parse_args()
+
+    output_format = args.format or os.path.splitext(args.output)[1].lstrip(".").lower()
+    if output_format not in OUTPUT_FORMATS:
+        parser.error(f"unknown output format '{output_format}', use --format")
+
+    videos, images = expand_inputs(args.inputs)
+    if not videos and not images:
+        print("[ERROR] No videos or images found.")
+        return
+
+    tasks = build_tasks(videos, images, max(1, args.shard_size), parse_range(args.frame_range))
+    workers = max(1, min(args.workers, len(tasks)))
+    print(f"[INFO] {len(videos)} video(s), {len(images)} image(s), {len(tasks)} task(s), {workers} worker(s)")
+
+    # the same detector settings as the app
+    from main import config
+    inference = dict(config["inference"])
+    if args.max_hands is not None:
+        inference["max_num_hands"] = args.max_hands
+    backend = args.backend or inference["backend"]
+    print(f"[INFO] Hand detection: {backend} ({inference['delegate']}), up to {inference['max_num_hands']} hands")
+    options = {
+        "backend": backend,
+        "inference": inference,
+        "size": (args.width, args.height) if args.width and args.height else None
+    }
+
+    records = []
+    worker_stats = {}
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=init_worker, initargs=(options,)) as pool:
+        for task_records, stats in pool.imap_unordered(process_task, tasks):
+            records.extend(task_records)
+            totals = worker_stats.setdefault(stats["pid"], {"frames": 0, "seconds": 0.0})
+            totals["frames"] += stats["frames"]
+            totals["seconds"] += stats["seconds"]
+            print(f"[INFO] {len(records)} frame(s) processed")
+    elapsed = time.perf_counter() - start
+
+    records.sort(key=lambda record: (record[0], record[1]))
+    WRITERS[output_format](records, args.output)
+
+    for pid, totals in sorted(worker_stats.items()):
+        fps = totals["frames"] / totals["seconds"] if totals["seconds"] else 0.0
+        print(f"[STATS] Worker {pid}: {totals['frames']} frames, {fps:.1f} frames/sec")
+    print(f"[STATS] Total: {len(records)} frames in {elapsed:.1f}s ({len(records) / elapsed:.1f} frames/sec)")
+    print(f"[OK] Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import os
+import time
+
+import numpy as np
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from synth import AudioEngine
+
+NOTES = {
+    "right": {0: 261.63, 1: 293.66, 2: 329.63, 3: 349.23, 4: 392.00},
+    "left": {0: 440.00, 1: 493.88, 2: 523.25, 3: 587.33, 4: 659.25}
+}
+FREQUENCIES = [frequency for hand_notes in NOTES.values() for frequency in hand_notes.values()]
+
+def time_bursts(play, bursts, burst_size, interval):
+    # a burst is every finger folding in the same frame, the worst case for the detection loop
+    costs = np.zeros(bursts)
+    for i in range(bursts):
+        start = time.perf_counter()
+        for j in range(burst_size):
+            play(FREQUENCIES[j % len(FREQUENCIES)])
+        costs[i] = time.perf_counter() - start
+        time.sleep(interval)
+    return costs
+
+def main():
+    parser = argparse.ArgumentParser(description="Piano note trigger cost, latency and drops")
+    parser.add_argument("--bursts", type=int, default=300)
+    parser.add_argument("--burst-size", type=int, default=10, help="notes triggered in one frame")
+    parser.add_argument("--interval", type=float, default=1 / 30, help="seconds between bursts")
+    parser.add_argument("--voices", type=int, default=8)
+    parser.add_argument("--queue-size", type=int, default=32)
+    parser.add_argument("--buffer-size", type=int, default=512)
+    args = parser.parse_args()
+
+    # trigger() alone, with no worker draining the queue
+    idle = AudioEngine(NOTES, queue_size=100000)
+    start = time.perf_counter()
+    for i in range(100000):
+        idle.trigger(FREQUENCIES[i % len(FREQUENCIES)])
+    trigger_cost = (time.perf_counter() - start) / 100000
+
+    engine = AudioEngine(NOTES, voices=args.voices, queue_size=args.queue_size, buffer_size=args.buffer_size)
+    engine.start()
+    try:
+        # playing on the caller's thread, as the piano did before the audio worker
+        direct = time_bursts(lambda frequency: engine._play(engine._note_ids[frequency]),
+                             args.bursts, args.burst_size, args.interval)
+        engine.stolen = 0
+        queued = time_bursts(engine.trigger, args.bursts, args.burst_size, args.interval)
+        time.sleep(0.2)
+    finally:
+        engine.stop()
+    stats = engine.stats()
+
+    print(f"[BENCH] {args.bursts} bursts of {args.burst_size} notes, {args.voices} voices, "
+          f"queue {args.queue_size}, buffer {args.buffer_size} samples")
+    print(f"{'':>10} {'p50 us':>9} {'p99 us':>9} {'max us':>9}   (cost per burst in the detection loop)")
+    for name, costs in (("direct", direct), ("queued", queued)):
+        print(f"{name:>10} {np.percentile(costs, 50) * 1e6:>9.1f} {np.percentile(costs, 99) * 1e6:>9.1f} "
+              f"{costs.max() * 1e6:>9.1f}")
+    print(f"[BENCH] trigger() alone: {trigger_cost * 1e6:.2f} us")
+    print(f"[BENCH] Played {stats['played']}/{stats['triggered']} notes, {stats['dropped']} dropped, "
+          f"{stats['stolen']} voices stolen, {stats['errors']} errors")
+    print(f"[BENCH] Queue latency p50 {stats['queue_latency_p50_ms']:.3f} ms, p99 {stats['queue_latency_p99_ms']:.3f} ms, "
+          f"plus {stats['buffer_latency_ms']:.1f} ms of mixer buffer")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from backends import BACKENDS, DEFAULT_OPTIONS, create_backend
+from benchmarks.bench_pipeline import load_frames
+from landmarks import results_to_arrays
+
+def candidates(backends, delegates):
+    for name in backends:
+        if name == "solutions":
+            yield name, "xnnpack"
+        else:
+            for delegate in delegates:
+                yield name, delegate
+
+def run_backend(name, options, frames, warmup, count):
+    start = time.perf_counter()
+    backend = create_backend(name, options)
+    init_time = time.perf_counter() - start
+    try:
+        start = time.perf_counter()
+        backend.process(frames[0])
+        first_time = time.perf_counter() - start
+        for i in range(warmup):
+            backend.process(frames[i % len(frames)])
+
+        costs = np.zeros(count)
+        hands = 0
+        wall_start = time.perf_counter()
+        completed_before = getattr(backend, "completed", 0)
+        for i in range(count):
+            start = time.perf_counter()
+            results = backend.process(frames[i % len(frames)])
+            costs[i] = time.perf_counter() - start
+            hands += len(results_to_arrays(results)[0])
+        if name == "tasks_live":
+            # process() only hands the frame over, count the results that came back instead,
+            # live stream mode drops frames while it is busy so not every frame gets one
+            deadline = time.perf_counter() + 2.0
+            while backend.completed < backend.submitted and time.perf_counter() < deadline:
+                time.sleep(0.001)
+            fps = (backend.completed - completed_before) / (time.perf_counter() - wall_start)
+        else:
+            fps = count / (time.perf_counter() - wall_start)
+    finally:
+        backend.close()
+    return {"init": init_time, "first": first_time, "p50": np.percentile(costs, 50),
+            "p95": np.percentile(costs, 95), "fps": fps, "hands": hands / count}
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the hand detection backends on this machine")
+    parser.add_argument("--frames-from", dest="frames_path", default="example-images",
+                        help="video file, image or image folder to detect hands in")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--delegates", nargs="+", choices=("xnnpack", "gpu"), default=["xnnpack", "gpu"])
+    parser.add_argument("--model-path", default=DEFAULT_OPTIONS["model_path"])
+    parser.add_argument("--model-complexity", type=int, default=DEFAULT_OPTIONS["model_complexity"])
+    parser.add_argument("--max-hands", type=int, default=DEFAULT_OPTIONS["max_num_hands"])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--width", type=int, default=960)
+    parser.add_argument("--height", type=int, default=720)
+    args = parser.parse_args()
+
+    frames = [cv2.cvtColor(cv2.resize(cv2.flip(frame, 1), (args.width, args.height)), cv2.COLOR_BGR2RGB)
+              for frame in load_frames(args.frames_path, args.frames, (args.width, args.height))]
+    options = dict(DEFAULT_OPTIONS, model_path=args.model_path, model_complexity=args.model_complexity,
+                   max_num_hands=args.max_hands)
+
+    print(f"[BENCH] {args.frames} frames of {args.width}x{args.height} from {args.frames_path}")
+    print(f"{'backend':>26} {'init s':>8} {'first ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'fps':>7} {'hands':>6}")
+    results = {}
+    for name, delegate in candidates(args.backends, args.delegates):
+        label = name if name == "solutions" else f"{name} ({delegate})"
+        try:
+            result = run_backend(name, dict(options, delegate=delegate), frames, args.warmup, args.frames)
+        except Exception as e:
+            print(f"{label:>26}   unavailable: {e}")
+            continue
+        results[label] = result
+        print(f"{label:>26} {result['init']:>8.2f} {result['first'] * 1000:>9.1f} {result['p50'] * 1000:>8.2f} "
+              f"{result['p95'] * 1000:>8.2f} {result['fps']:>7.1f} {result['hands']:>6.2f}")
+
+    if not results:
+        print("[ERROR] No backend could run on this machine")
+        return
+    fastest = max(results, key=lambda label: results[label]["fps"])
+    print(f"\n[BENCH] Fastest on this machine: {fastest} at {results[fastest]['fps']:.1f} fps")
+    name, _, delegate = fastest.partition(" (")
+    print(f"[INFO] To use it set \"backend\": \"{name}\"" + (f" and \"delegate\": \"{delegate.rstrip(')')}\"" if delegate else "")
+          + " in the inference section of config.json")
+
+if __name__ == "__main__":
+    main()
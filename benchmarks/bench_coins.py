@@ -0,0 +1,100 @@
+import argparse
+import time
+
+import numpy as np
+
+from coins import CoinsGame
+
+WIDTH = 960
+HEIGHT = 720
+POINTS_PER_FRAME = 42
+
+def time_ticks(coin_count, ball_count, ticks, seed):
+    game = CoinsGame(WIDTH, HEIGHT, seed=seed, balls=ball_count, spawn_interval=1e9)
+    while len(game.field) < coin_count:
+        game.spawn_coin()
+    # points far from every coin and ball so nothing is collected and each tick costs the same
+    points = np.column_stack((np.arange(POINTS_PER_FRAME), np.full(POINTS_PER_FRAME, -1000)))
+    step_costs = np.zeros(ticks)
+    collide_costs = np.zeros(ticks)
+    for i in range(ticks):
+        start = time.perf_counter()
+        game.step()
+        middle = time.perf_counter()
+        game.collide(points)
+        step_costs[i] = middle - start
+        collide_costs[i] = time.perf_counter() - middle
+    return step_costs, collide_costs
+
+def run_frames(frame_times, seed):
+    game = CoinsGame(WIDTH, HEIGHT, seed=seed)
+    for timestamp in frame_times:
+        game.advance(timestamp)
+    return game
+
+def soak(seconds, fps, seed):
+    # two hands wandering over the screen, collecting coins and now and then hitting the ball
+    game = CoinsGame(WIDTH, HEIGHT, seed=seed)
+    rng = np.random.default_rng(seed)
+    centres = rng.uniform((100, 100), (WIDTH - 100, HEIGHT - 100), (2, 2))
+    offsets = rng.uniform(-60, 60, (21, 2))
+    restarts = 0
+    collected = 0
+    frames = int(seconds * fps)
+    start = time.perf_counter()
+    for i in range(frames):
+        was_over = game.game_over
+        game.advance(i / fps)
+        restarts += was_over and not game.game_over
+        centres = np.clip(centres + rng.normal(0, 8, centres.shape), 60, (WIDTH - 60, HEIGHT - 60))
+        points = (centres[:, np.newaxis] + offsets).reshape(-1, 2).astype(int)
+        collected += game.collide(points)
+    return game, time.perf_counter() - start, restarts, collected
+
+def main():
+    parser = argparse.ArgumentParser(description="Coins game simulation benchmark")
+    parser.add_argument("--coins", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--balls", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--soak-seconds", type=float, default=600.0, help="simulated seconds of play")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # the game steps every tick, collisions against the hands only run once per camera frame
+    print(f"[BENCH] p50 us per tick step / per collision against {POINTS_PER_FRAME} landmarks")
+    print(f"{'coins':>8}" + "".join(f"{f'{balls} balls':>20}" for balls in args.balls))
+    for coin_count in args.coins:
+        row = f"{coin_count:>8}"
+        for ball_count in args.balls:
+            step_costs, collide_costs = time_ticks(coin_count, ball_count, args.ticks, args.seed)
+            row += f"{np.percentile(step_costs, 50) * 1e6:>11.1f} / {np.percentile(collide_costs, 50) * 1e6:>6.1f}"
+        print(row)
+
+    print("\n[BENCH] 60 simulated seconds at different frame rates")
+    print(f"{'frames':>12} {'ticks':>7} {'coins':>6}   ball")
+    rng = np.random.default_rng(args.seed)
+    schedules = {
+        "15 fps": np.arange(0, 60, 1 / 15),
+        "30 fps": np.arange(0, 60, 1 / 30),
+        "144 fps": np.arange(0, 60, 1 / 144),
+        "jittery": np.cumsum(np.append(0.0, rng.uniform(0.005, 0.06, 2000)))
+    }
+    for name, frame_times in schedules.items():
+        frame_times = np.append(frame_times[frame_times < 60], 60.0)
+        game = run_frames(frame_times.tolist(), args.seed)
+        x, y = game.balls[0, :2]
+        print(f"{name:>12} {game.ticks:>7} {len(game.field):>6}   ({x:.1f}, {y:.1f})")
+
+    game, elapsed, restarts, collected = soak(args.soak_seconds, 30, args.seed)
+    repeat, _, _, _ = soak(args.soak_seconds, 30, args.seed)
+    print(f"\n[BENCH] Soak: {args.soak_seconds:.0f} simulated seconds at 30 fps in {elapsed:.2f}s, "
+          f"{game.ticks / elapsed:.0f} ticks/sec ({args.soak_seconds / elapsed:.0f}x real time)")
+    print(f"[BENCH] {collected} coins collected, {restarts} restarts, final score {game.score}, "
+          f"{game.skipped_ticks} ticks skipped")
+    if repeat.state_hash() == game.state_hash():
+        print(f"[OK] Same seed, same game: state matches after {game.ticks} ticks")
+    else:
+        print("[WARNING] Two runs with the same seed ended in different states")
+
+if __name__ == "__main__":
+    main()
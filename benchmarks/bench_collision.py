@@ -0,0 +1,76 @@
+import argparse
+import time
+
+import numpy as np
+
+from collision import CollisionField
+
+WIDTH = 960
+HEIGHT = 720
+POINTS_PER_FRAME = 42
+
+def check_collision_scalar(point_x, point_y, obj_x, obj_y, obj_radius):
+    distance = np.sqrt((point_x - obj_x)**2 + (point_y - obj_y)**2)
+    return distance < obj_radius
+
+def collide_scalar(coins, ball, points):
+    # the per-landmark, per-coin loop the coins game used before CollisionField
+    for px, py in points:
+        for coin in coins[:]:
+            if not coin["collected"] and check_collision_scalar(px, py, coin["x"], coin["y"], coin["radius"]):
+                coin["collected"] = True
+                coins.remove(coin)
+                break
+        if check_collision_scalar(px, py, int(ball["x"]), int(ball["y"]), ball["radius"]):
+            break
+
+def make_scene(rng, coin_count):
+    coins = np.column_stack((
+        rng.integers(30, WIDTH - 30, coin_count),
+        rng.integers(30, HEIGHT - 30, coin_count),
+        np.full(coin_count, 25)
+    ))
+    # points far from every coin so nothing is collected and each frame costs the same
+    points = np.column_stack((
+        rng.integers(0, WIDTH, POINTS_PER_FRAME),
+        np.full(POINTS_PER_FRAME, -1000)
+    ))
+    return coins, points
+
+def time_scalar(coins, points, frames):
+    coin_dicts = [{"x": int(x), "y": int(y), "radius": int(r), "collected": False} for x, y, r in coins]
+    ball = {"x": WIDTH // 2, "y": 25, "radius": 20}
+    point_list = points.tolist()
+    start = time.perf_counter()
+    for _ in range(frames):
+        collide_scalar(coin_dicts, ball, point_list)
+    return (time.perf_counter() - start) / frames
+
+def time_vectorized(coins, points, frames):
+    field = CollisionField()
+    for x, y, r in coins:
+        field.add_coin(x, y, r)
+    field.set_ball(WIDTH // 2, 25, 20)
+    start = time.perf_counter()
+    for _ in range(frames):
+        field.collide(points)
+    return (time.perf_counter() - start) / frames
+
+def main():
+    parser = argparse.ArgumentParser(description="Coins game collision benchmark")
+    parser.add_argument("--coins", type=int, nargs="+", default=[10, 100, 1000, 5000, 10000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    print(f"[BENCH] {POINTS_PER_FRAME} landmarks per frame (2 hands)")
+    print(f"{'coins':>8} {'scalar ms':>12} {'vector ms':>12} {'speedup':>9}")
+    for coin_count in args.coins:
+        coins, points = make_scene(rng, coin_count)
+        scalar_frames = max(1, 2000 // coin_count)
+        scalar = time_scalar(coins, points, scalar_frames)
+        vector = time_vectorized(coins, points, 200)
+        print(f"{coin_count:>8} {scalar * 1000:>12.3f} {vector * 1000:>12.3f} {scalar / vector:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import argparse
+import glob
+import json
+import os
+import platform
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import cv2
+import numpy as np
+
+import main
+from benchmarks.hands import synthetic_arrays
+from landmarks import arrays_to_results
+from profiler import StageProfiler
+
+SCENARIOS = {
+    "idle-0hands": {"hands": 0, "game": None},
+    "count-1hand": {"hands": 1, "game": None},
+    "count-2hands": {"hands": 2, "game": None},
+    "piano-2hands": {"hands": 2, "game": "piano_game"},
+    "coins-2hands": {"hands": 2, "game": "coins_game"}
+}
+
+def synthetic_hands(frame_index, hand_count, rng):
+    return arrays_to_results(*synthetic_arrays(frame_index, hand_count, rng))
+
+def load_frames(path, count, size):
+    if path is None:
+        rng = np.random.default_rng(0)
+        base = cv2.resize(rng.integers(0, 256, (size[1] // 8, size[0] // 8, 3), dtype=np.uint8), size)
+        return [np.roll(base, shift * 4, axis=1) for shift in range(min(count, 30))]
+
+    if os.path.isdir(path):
+        frames = [cv2.imread(p) for p in sorted(glob.glob(os.path.join(path, "*")))]
+        frames = [frame for frame in frames if frame is not None]
+    elif os.path.splitext(path)[1].lower() in (".png", ".jpg", ".jpeg", ".bmp"):
+        frames = [cv2.imread(path)]
+    else:
+        frames = []
+        cap = cv2.VideoCapture(path)
+        while len(frames) < count:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+        cap.release()
+    if not frames:
+        raise SystemExit(f"[ERROR] No frames could be read from {path}")
+    return frames[:count]
+
+def set_scenario(scenario):
+    for game in main.config["GAMES"]:
+        main.config["GAMES"][game] = game == scenario["game"]
+    main.hand_tracker.reset()
+    main.coins_game = None
+    if scenario["game"] == "piano_game" and main.audio_engine is None:
+        main.init_piano()
+    elif scenario["game"] == "coins_game":
+        main.coins_game = main.init_coins_game()
+
+def refill_coins(coin_count):
+    game = main.coins_game
+    game.game_over = False
+    while len(game.field) < coin_count:
+        game.spawn_coin()
+
+def run_scenario(name, scenario, frames, args):
+    main.config["coins"]["seed"] = args.seed
+    rng = np.random.default_rng(args.seed)
+    set_scenario(scenario)
+    profiler = StageProfiler(window=args.frames)
+    main.profiler = profiler
+
+    for i in range(args.warmup + args.frames):
+        if i == args.warmup:
+            profiler = StageProfiler(window=args.frames)
+            main.profiler = profiler
+            start_time = time.perf_counter()
+        if scenario["game"] == "coins_game":
+            refill_coins(args.coins)
+
+        start = profiler.now()
+        frame, results, arrays = main.infer_frame(frames[i % len(frames)])
+        if not args.detected_results:
+            results, arrays = synthetic_hands(i, scenario["hands"], rng), None
+        main.render_frame(frame, results, 0, 1, arrays=arrays)
+        main.preprocessor.release(frame)
+        profiler.record("frame", start)
+
+    elapsed = time.perf_counter() - start_time
+    return {"fps": args.frames / elapsed, "stages": profiler.summary()}
+
+def print_report(report, baseline=None):
+    for name, result in report["scenarios"].items():
+        line = f"\n[BENCH] {name}: {result['fps']:.1f} frames/sec"
+        base = baseline["scenarios"].get(name) if baseline else None
+        if base:
+            line += f" (baseline {base['fps']:.1f}, {100 * (result['fps'] / base['fps'] - 1):+.1f}%)"
+        print(line)
+        print(f"  {'stage':<10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}" + ("   p50 vs baseline" if base else ""))
+        for stage, s in result["stages"].items():
+            row = f"  {stage:<10} {s['p50'] * 1000:>8.3f} {s['p95'] * 1000:>8.3f} {s['p99'] * 1000:>8.3f}"
+            if base and stage in base["stages"] and base["stages"][stage]["p50"] > 0:
+                row += f"   {100 * (s['p50'] / base['stages'][stage]['p50'] - 1):+.1f}%"
+            print(row)
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Replay frames through the per-frame path of main() without camera or window")
+    parser.add_argument("--frames-from", dest="frames_path", help="video file, image or image folder to replay (default: synthetic frames)")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--frames", type=int, default=300, help="measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--coins", type=int, default=20, help="coins on screen in the coins scenario")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--width", type=int, default=640, help="width of synthetic frames")
+    parser.add_argument("--height", type=int, default=480, help="height of synthetic frames")
+    parser.add_argument("--detected-results", action="store_true",
+                        help="use the hands detected in the frames instead of synthetic hands")
+    parser.add_argument("-o", "--output", help="save the results as JSON")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    args = parser.parse_args()
+
+    frames = load_frames(args.frames_path, args.warmup + args.frames, (args.width, args.height))
+    main.governor = None
+    main.roi_tracker = None
+    main.config["roi_tracking"]["enabled"] = False
+    main.config["profiler"]["overlay"] = False
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": {"platform": platform.platform(), "processor": platform.processor(), "cpus": os.cpu_count()},
+        "settings": {"frames_from": args.frames_path or "synthetic", "frames": args.frames, "warmup": args.warmup,
+                     "coins": args.coins, "seed": args.seed, "detected_results": args.detected_results,
+                     "window": [main.WINDOW_WIDTH, main.WINDOW_HEIGHT]},
+        "scenarios": {}
+    }
+    for name in args.scenarios:
+        print(f"[INFO] Running scenario {name}...")
+        report["scenarios"][name] = run_scenario(name, SCENARIOS[name], frames, args)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4)
+        print(f"\n[OK] Results saved to {args.output}")
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,107 @@
+import argparse
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+import preprocess
+from preprocess import FramePreprocessor
+
+WIDTH = 960
+HEIGHT = 720
+COUNTED = ("flip", "resize", "cvtColor")
+
+
+class CountingCv2:
+    # stands in for the cv2 module and adds up the bytes each image call actually reads and writes
+    def __init__(self):
+        self.bytes = 0
+
+    def __getattr__(self, name):
+        attr = getattr(cv2, name)
+        if name not in COUNTED:
+            return attr
+
+        def call(src, *args, **kwargs):
+            output = attr(src, *args, **kwargs)
+            self.bytes += src.nbytes + output.nbytes
+            return output
+        return call
+
+def legacy_preprocess(cv, frame, inference_size):
+    # the per-frame path before FramePreprocessor: every step returns a new full-size array
+    display = cv.resize(cv.flip(frame, 1), (WIDTH, HEIGHT))
+    inference_frame = display
+    if inference_size is not None and inference_size != (WIDTH, HEIGHT):
+        inference_frame = cv.resize(display, inference_size, interpolation=cv.INTER_AREA)
+    return display, cv.cvtColor(inference_frame, cv.COLOR_BGR2RGB)
+
+def buffered_preprocess(preprocessor, frame, inference_size):
+    # same calls as main.preprocess_frame
+    display = preprocessor.display(frame)
+    return display, preprocessor.rgb(frame, inference_size or (WIDTH, HEIGHT))
+
+def run_frames(path, frame, inference_size, frames, cv=cv2, traced=False):
+    preprocessor = FramePreprocessor(WIDTH, HEIGHT)
+    costs = np.zeros(frames)
+    allocated = 0
+    for i in range(frames):
+        if traced:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        if path == "legacy":
+            display, rgb_frame = legacy_preprocess(cv, frame, inference_size)
+        else:
+            display, rgb_frame = buffered_preprocess(preprocessor, frame, inference_size)
+        costs[i] = time.perf_counter() - start
+        if traced:
+            allocated += tracemalloc.get_traced_memory()[1] - before
+        if path != "legacy":
+            # the render thread is done with the frame
+            preprocessor.release(display)
+        del display, rgb_frame
+    return costs, allocated / frames
+
+def measure(path, frame, inference_size, frames):
+    run_frames(path, frame, inference_size, 20)
+    costs, _ = run_frames(path, frame, inference_size, frames)
+
+    tracemalloc.start()
+    _, allocated = run_frames(path, frame, inference_size, min(frames, 100), traced=True)
+    tracemalloc.stop()
+
+    counter = CountingCv2()
+    preprocess.cv2 = counter
+    try:
+        run_frames(path, frame, inference_size, 10, cv=counter)
+    finally:
+        preprocess.cv2 = cv2
+    return np.percentile(costs, 50), allocated, counter.bytes / 10
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-frame time, allocations and image bytes of the frame preprocessing")
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--camera", nargs="+", default=["960x720", "1280x720", "640x480"],
+                        help="camera frame sizes to preprocess into the 960x720 window")
+    parser.add_argument("--scales", type=float, nargs="+", default=[1.0, 0.6],
+                        help="governor inference scales")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"[BENCH] {args.frames} frames into a {WIDTH}x{HEIGHT} window, legacy -> buffered")
+    print("[BENCH] allocated: tracemalloc per frame; image MB: bytes read and written by flip/resize/cvtColor calls")
+    print(f"{'camera':>10} {'scale':>6} {'p50 ms':>16} {'MB allocated':>17} {'image MB':>16}")
+    for camera in args.camera:
+        width, height = (int(value) for value in camera.split("x"))
+        frame = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        for scale in args.scales:
+            inference_size = None if scale == 1.0 else (int(WIDTH * scale), int(HEIGHT * scale))
+            old_p50, old_alloc, old_bytes = measure("legacy", frame, inference_size, args.frames)
+            new_p50, new_alloc, new_bytes = measure("buffered", frame, inference_size, args.frames)
+            print(f"{camera:>10} {scale:>6.1f} {old_p50 * 1000:>7.3f} -> {new_p50 * 1000:<6.3f} "
+                  f"{old_alloc / 1e6:>6.2f} -> {new_alloc / 1e6:<7.2f} {old_bytes / 1e6:>6.2f} -> {new_bytes / 1e6:<6.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import json
+import subprocess
+import sys
+
+import numpy as np
+
+# each case runs in a fresh interpreter so nothing is already imported
+CASES = {
+    "import main": """
+import main
+""",
+    "import main, eager": """
+import main
+main.load_model(warmup=True)
+main.load_pygame()
+""",
+    "first frame, sequential": """
+import time
+import numpy as np
+import main
+main.load_model(warmup=True)
+time.sleep(CAMERA_OPEN)
+frame = np.zeros((main.WINDOW_HEIGHT, main.WINDOW_WIDTH, 3), dtype=np.uint8)
+frame, results, arrays = main.infer_frame(frame)
+main.render_frame(frame, results, 0, 1, arrays=arrays)
+""",
+    "first frame, warm-up": """
+import time
+import numpy as np
+import main
+main.start_model_warmup()
+time.sleep(CAMERA_OPEN)
+frame = np.zeros((main.WINDOW_HEIGHT, main.WINDOW_WIDTH, 3), dtype=np.uint8)
+frame, results, arrays = main.infer_frame(frame)
+main.render_frame(frame, results, 0, 1, arrays=arrays)
+"""
+}
+
+REPORT = """
+import json, sys, time
+print(json.dumps({"elapsed": time.perf_counter() - START,
+                  "modules": [name for name in ("cv2", "mediapipe", "pygame") if name in sys.modules]}))
+"""
+
+def run_case(code, camera_open):
+    script = ("import time\nSTART = time.perf_counter()\nCAMERA_OPEN = " + repr(camera_open) + "\n"
+              + code + REPORT)
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup time benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--camera-open", type=float, default=0.5,
+                        help="seconds the simulated camera takes to open")
+    args = parser.parse_args()
+
+    print(f"[BENCH] Median of {args.runs} fresh interpreters, camera open simulated as {args.camera_open}s")
+    print(f"{'case':>26} {'seconds':>9}   modules loaded")
+    for name, code in CASES.items():
+        runs = [run_case(code, args.camera_open) for _ in range(args.runs)]
+        elapsed = np.median([run["elapsed"] for run in runs])
+        print(f"{name:>26} {elapsed:>9.3f}   {', '.join(runs[-1]['modules'])}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from landmarks import NUM_LANDMARKS, finger_states_batch
+from stream_client import connect, decode_message, read_messages
+from stream_server import LandmarkStreamServer, encode_frame, msgpack
+
+def make_frames(rng, count, hand_count):
+    frames = []
+    for _ in range(count):
+        landmarks = rng.random((hand_count, NUM_LANDMARKS, 3), dtype=np.float32)
+        is_right = np.arange(hand_count) % 2 == 0
+        frames.append((landmarks, is_right, finger_states_batch(landmarks, is_right)))
+    return frames
+
+def subscribe(port, encoding, delay, counters, stop):
+    sock = connect("127.0.0.1", port)
+    sock.settimeout(1.0)
+    try:
+        for payload in read_messages(sock):
+            counters["frames"] += 1
+            counters["bytes"] += len(payload)
+            # how old a frame is when the subscriber gets to it
+            counters["age"] = max(counters["age"], time.time() - decode_message(payload, encoding)["timestamp"])
+            if delay:
+                time.sleep(delay)
+            if stop.is_set():
+                break
+    except (ConnectionError, OSError):
+        pass
+    finally:
+        sock.close()
+
+def run(encoding, frames, args):
+    server = LandmarkStreamServer(port=0, encoding=encoding, queue_size=args.queue_size)
+    server.start()
+    port = server.addresses["tcp"][1]
+
+    stop = threading.Event()
+    delays = [0.0] * args.clients + [args.slow_delay] * args.slow_clients
+    counters = [{"frames": 0, "bytes": 0, "age": 0.0} for _ in delays]
+    threads = [threading.Thread(target=subscribe, args=(port, encoding, delay, counter, stop), daemon=True)
+               for delay, counter in zip(delays, counters)]
+    for thread in threads:
+        thread.start()
+    while len(server.stats()["clients"]) < len(threads):
+        time.sleep(0.01)
+
+    interval = 1.0 / args.rate if args.rate else 0.0
+    publish_times = np.zeros(args.frames)
+    start_time = time.perf_counter()
+    for i in range(args.frames):
+        start = time.perf_counter()
+        server.publish(*frames[i % len(frames)])
+        publish_times[i] = time.perf_counter() - start
+        if interval:
+            remaining = start_time + (i + 1) * interval - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+    elapsed = time.perf_counter() - start_time
+    time.sleep(0.2)
+
+    stats = server.stats()
+    stop.set()
+    server.stop()
+    for thread in threads:
+        thread.join(1.0)
+
+    return {
+        "publish_rate": args.frames / elapsed,
+        "publish_p50_us": np.percentile(publish_times, 50) * 1e6,
+        "publish_p99_us": np.percentile(publish_times, 99) * 1e6,
+        "fast": counters[:args.clients],
+        "slow": counters[args.clients:],
+        "coalesced": stats["coalesced"],
+        "dropped": sum(client["dropped"] for client in stats["clients"]),
+        "elapsed": elapsed
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Landmark stream server throughput benchmark")
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--hands", type=int, default=2)
+    parser.add_argument("--clients", type=int, default=4, help="subscribers that read as fast as they can")
+    parser.add_argument("--slow-clients", type=int, default=1, help="subscribers that sleep after every message")
+    parser.add_argument("--slow-delay", type=float, default=0.01, help="seconds a slow subscriber sleeps per message")
+    parser.add_argument("--rate", type=float, default=1000, help="publish rate in frames/sec, 0 publishes as fast as possible")
+    parser.add_argument("--queue-size", type=int, default=4)
+    parser.add_argument("--encodings", nargs="+", default=["binary", "json"] + (["msgpack"] if msgpack else []))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    frames = make_frames(np.random.default_rng(args.seed), 100, args.hands)
+    print(f"[BENCH] {args.hands} hands per frame, {args.clients} fast + {args.slow_clients} slow subscriber(s), "
+          f"{args.frames} frames")
+    for encoding in args.encodings:
+        size = sum(len(part) for part in encode_frame(encoding, (1, time.time()) + frames[0]))
+        result = run(encoding, frames, args)
+        fast_fps = [c["frames"] / result["elapsed"] for c in result["fast"]]
+        fast_mb = sum(c["bytes"] for c in result["fast"]) / result["elapsed"] / 1e6
+        print(f"\n[BENCH] {encoding}: {size} bytes/frame")
+        print(f"  publish: {result['publish_rate']:.0f} frames/sec, "
+              f"p50 {result['publish_p50_us']:.1f} us, p99 {result['publish_p99_us']:.1f} us per call")
+        if fast_fps:
+            print(f"  fast subscribers: {min(fast_fps):.0f}-{max(fast_fps):.0f} frames/sec each, {fast_mb:.1f} MB/s total")
+        for client in result["slow"]:
+            print(f"  slow subscriber: {client['frames']} frames received, oldest {client['age'] * 1000:.0f} ms old")
+        print(f"  dropped for slow readers: {result['dropped']} frames, "
+              f"coalesced before encoding: {result['coalesced']} frames")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import time
+
+import numpy as np
+
+from synth import MAX_SAMPLE, generate_tone
+
+NOTES = [261.63, 293.66, 329.63, 349.23, 392.00, 440.00, 493.88, 523.25, 587.33, 659.25]
+
+def generate_tone_loop(frequency, duration=0.2, sample_rate=22050):
+    frames = int(duration * sample_rate)
+    arr = np.zeros((frames, 2), dtype=np.int16)
+    
+    for i in range(frames):
+        t = float(i) / sample_rate
+        wave = 4096 * np.sin(2 * np.pi * frequency * t)
+        envelope = 1.0
+        if i < frames * 0.1:
+            envelope = i / (frames * 0.1)
+        elif i > frames * 0.7:
+            envelope = 1.0 - ((i - frames * 0.7) / (frames * 0.3))
+        wave *= envelope
+        arr[i][0] = int(np.clip(wave, -MAX_SAMPLE, MAX_SAMPLE))
+        arr[i][1] = int(np.clip(wave, -MAX_SAMPLE, MAX_SAMPLE))
+    return arr
+
+def time_per_note(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for frequency in NOTES:
+            fn(frequency)
+    return (time.perf_counter() - start) / (repeat * len(NOTES))
+
+def main():
+    parser = argparse.ArgumentParser(description="Tone synthesis microbenchmark")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    for frequency in NOTES:
+        if not np.array_equal(generate_tone_loop(frequency), generate_tone(frequency)):
+            print(f"[WARNING] Vectorized tone differs from loop tone at {frequency} Hz")
+    
+    loop_cost = time_per_note(generate_tone_loop, args.repeat)
+    vector_cost = time_per_note(generate_tone, args.repeat * 100)
+    
+    print(f"[BENCH] Per-sample loop: {loop_cost * 1000:.3f} ms/note")
+    print(f"[BENCH] Vectorized:      {vector_cost * 1000:.3f} ms/note")
+    print(f"[BENCH] Speedup:         {loop_cost / vector_cost:.1f}x")
+    print(f"[BENCH] Tone bank render ({len(NOTES)} notes): {vector_cost * len(NOTES) * 1000:.3f} ms, "
+          f"0 ms per key press afterwards")
+
+if __name__ == "__main__":
+    main()
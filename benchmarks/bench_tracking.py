@@ -0,0 +1,82 @@
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.hands import synthetic_arrays
+from landmarks import finger_states_batch
+from tracking import HandTracker, FINGER_DOWN
+
+SMOOTHING = {"min_cutoff": 1.0, "beta": 5.0, "d_cutoff": 1.0}
+
+def make_session(rng, frames, hand_count, noise, hold_frames, shuffle):
+    session = []
+    for i in range(frames):
+        landmarks, is_right = synthetic_arrays(i, hand_count, rng, noise=noise, hold_frames=hold_frames)
+        if shuffle:
+            # MediaPipe doesn't keep the detection order between frames
+            order = rng.permutation(hand_count)
+            landmarks, is_right = landmarks[order], is_right[order]
+        session.append((landmarks, is_right))
+    return session
+
+def count_raw_notes(session):
+    # the edge detection the piano game used before the tracker: keyed by detection order, no debouncing
+    previous = {}
+    notes = 0
+    for landmarks, is_right in session:
+        states = finger_states_batch(landmarks, is_right)
+        hand_ids = [f"{'right' if right else 'left'}_{idx}" for idx, right in enumerate(is_right)]
+        for hand_id, hand_states in zip(hand_ids, states):
+            if hand_id in previous:
+                notes += int((previous[hand_id] & ~hand_states).sum())
+            previous[hand_id] = hand_states
+    return notes
+
+def count_tracked_notes(session, fps, smoothing, debounce_frames):
+    tracker = HandTracker(smoothing=smoothing, debounce_frames=debounce_frames)
+    notes = 0
+    for i, (landmarks, is_right) in enumerate(session):
+        events = tracker.update(landmarks, is_right, i / fps)
+        notes += sum(event["type"] == FINGER_DOWN for event in events)
+    return notes
+
+def time_tracker(session, fps, smoothing, debounce_frames):
+    tracker = HandTracker(smoothing=smoothing, debounce_frames=debounce_frames)
+    start = time.perf_counter()
+    for i, (landmarks, is_right) in enumerate(session):
+        tracker.update(landmarks, is_right, i / fps)
+    return (time.perf_counter() - start) / len(session)
+
+def main():
+    parser = argparse.ArgumentParser(description="Hand tracker overhead and note accuracy benchmark")
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--hold-frames", type=int, default=15, help="frames each finger stays folded")
+    parser.add_argument("--noise", type=float, nargs="+", default=[0.003, 0.01, 0.02],
+                        help="landmark jitter as a fraction of the frame")
+    parser.add_argument("--debounce", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"[BENCH] Per-frame cost of HandTracker.update ({args.frames} frames)")
+    print(f"{'hands':>6} {'raw us':>10} {'smoothed us':>12}")
+    for hand_count in (0, 1, 2, 4):
+        session = make_session(rng, args.frames, hand_count, 0.003, args.hold_frames, False)
+        raw = time_tracker(session, args.fps, None, args.debounce)
+        smoothed = time_tracker(session, args.fps, SMOOTHING, args.debounce)
+        print(f"{hand_count:>6} {raw * 1e6:>10.1f} {smoothed * 1e6:>12.1f}")
+
+    expected = 2 * (args.frames // args.hold_frames - 1)
+    print(f"\n[BENCH] Piano notes for 2 hands, {expected} real finger presses, detection order shuffled")
+    print(f"{'noise':>7} {'before':>8} {'debounce':>9} {'smoothed':>9}")
+    for noise in args.noise:
+        session = make_session(rng, args.frames, 2, noise, args.hold_frames, True)
+        before = count_raw_notes(session)
+        debounced = count_tracked_notes(session, args.fps, None, args.debounce)
+        smoothed = count_tracked_notes(session, args.fps, SMOOTHING, args.debounce)
+        print(f"{noise:>7.3f} {before:>8} {debounced:>9} {smoothed:>9}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import numpy as np
+
+from landmarks import NUM_LANDMARKS
+
+# open hand in hand-size units, wrist at the origin, fingers pointing up (negative y)
+HAND_TEMPLATE = np.array([
+    (0.00, 0.00),
+    (-0.15, -0.08), (-0.27, -0.18), (-0.36, -0.28), (-0.45, -0.36),
+    (-0.12, -0.42), (-0.14, -0.62), (-0.15, -0.75), (-0.16, -0.87),
+    (0.00, -0.45), (0.00, -0.67), (0.00, -0.81), (0.00, -0.94),
+    (0.11, -0.42), (0.12, -0.61), (0.13, -0.74), (0.14, -0.85),
+    (0.21, -0.36), (0.24, -0.50), (0.26, -0.60), (0.28, -0.70)
+])
+FINGER_JOINTS = [(2, 3, 4), (6, 7, 8), (10, 11, 12), (14, 15, 16), (18, 19, 20)]
+
+def synthetic_arrays(frame_index, hand_count, rng, noise=0.003, hold_frames=5):
+    landmarks = np.zeros((hand_count, NUM_LANDMARKS, 3), dtype=np.float32)
+    is_right = np.array([i == 0 for i in range(hand_count)], dtype=bool)
+    for i in range(hand_count):
+        points = HAND_TEMPLATE.copy()
+        # open and close one finger after another so the piano game fires notes
+        folded = (frame_index // hold_frames + i) % 5
+        pip, dip, tip = FINGER_JOINTS[folded]
+        points[dip, 1] = points[pip, 1] + 0.05
+        points[tip, 1] = points[pip, 1] + 0.10
+        if folded == 0:
+            points[tip, 0] = points[pip, 0] + 0.05
+        if is_right[i]:
+            points[:, 0] = -points[:, 0]
+
+        center = (0.3 + 0.4 * i, 0.75)
+        landmarks[i, :, 0] = center[0] + 0.25 * points[:, 0] + rng.normal(0, noise, NUM_LANDMARKS)
+        landmarks[i, :, 1] = center[1] + 0.25 * points[:, 1] + rng.normal(0, noise, NUM_LANDMARKS)
+    return landmarks, is_right
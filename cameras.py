@@ -0,0 +1,251 @@
+import json
+import os
+import queue
+import threading
+import time
+
+import cv2
+
+BACKENDS = [
+    (cv2.CAP_DSHOW, "DirectShow"),
+    (cv2.CAP_MSMF, "Media Foundation"),
+    (cv2.CAP_V4L2, "V4L2"),
+    (cv2.CAP_ANY, "Any")
+]
+
+def probe_camera(camera_index):
+    for backend_id, backend_name in BACKENDS:
+        try:
+            test_cap = cv2.VideoCapture(camera_index, backend_id)
+            if test_cap.isOpened():
+                ret, test_frame = test_cap.read()
+                test_cap.release()
+                if ret and test_frame is not None:
+                    height, width = test_frame.shape[:2]
+                    return {
+                        "index": camera_index,
+                        "backend_id": backend_id,
+                        "backend_name": backend_name,
+                        "width": width,
+                        "height": height
+                    }
+            else:
+                test_cap.release()
+        except cv2.error:
+            pass
+    return None
+
+def scan_cameras(max_index=10, timeout=3.0, preferred_index=None, on_complete=None, first_camera_timeout=15.0):
+    # probes run on daemon threads so a driver that hangs can't block startup or exit
+    found = []
+    results = queue.Queue()
+    pending = set(range(max_index))
+    lock = threading.Lock()
+
+    def probe(camera_index):
+        results.put((camera_index, probe_camera(camera_index)))
+
+    def collect(deadline, stop_at_preferred=False, stop_at_first=False):
+        # True once every probe has finished, False when stopped early
+        while pending:
+            remaining = None if deadline is None else deadline - time.time()
+            if remaining is not None and remaining <= 0:
+                return False
+            try:
+                camera_index, camera_info = results.get(timeout=remaining)
+            except queue.Empty:
+                return False
+            with lock:
+                pending.discard(camera_index)
+                if camera_info is not None:
+                    found.append(camera_info)
+                    found.sort(key=lambda info: info["index"])
+                    print(f"[OK] Camera {camera_index} found using {camera_info['backend_name']}")
+            if camera_info is not None and (stop_at_first or (stop_at_preferred and camera_index == preferred_index)):
+                return False
+        return True
+
+    print("[INFO] Scanning for all available cameras...")
+    for camera_index in range(max_index):
+        threading.Thread(target=probe, args=(camera_index,), name=f"probe-{camera_index}", daemon=True).start()
+
+    complete = collect(time.time() + timeout, stop_at_preferred=preferred_index is not None)
+    if not complete and not found:
+        # slow DirectShow/MSMF opens: wait longer for the first camera, but never forever
+        print(f"[INFO] No camera answered within {timeout:g}s, waiting up to {first_camera_timeout:g}s "
+              f"for {len(pending)} probe(s)")
+        complete = collect(time.time() + first_camera_timeout, stop_at_first=True)
+        if not complete and not found:
+            print(f"[WARNING] No camera answered within {timeout + first_camera_timeout:g}s")
+
+    with lock:
+        cameras = list(found)
+    if complete:
+        if on_complete is not None:
+            on_complete(cameras)
+    else:
+        print(f"[INFO] Continuing camera scan in the background ({len(pending)} probe(s) left)")
+
+        def finish():
+            # cameras found from here on only go to on_complete, the caller keeps its snapshot
+            collect(None)
+            if on_complete is not None:
+                on_complete(list(found))
+
+        threading.Thread(target=finish, name="camera-scan", daemon=True).start()
+    return cameras
+
+def load_camera_cache(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cameras = json.load(f)["cameras"]
+        print(f"[OK] {len(cameras)} camera(s) loaded from {path}")
+        return cameras
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[WARNING] Error loading camera cache: {e}")
+        return None
+
+def save_camera_cache(path, cameras):
+    if not cameras:
+        return
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"created": time.time(), "cameras": cameras}, f, indent=4)
+    except OSError as e:
+        print(f"[WARNING] Could not write camera cache: {e}")
+
+def invalidate_camera_cache(path):
+    if os.path.exists(path):
+        os.remove(path)
+        print(f"[INFO] Camera cache {path} is out of date, cameras will be scanned on next launch")
+
+def open_camera(camera_info, width, height, timeout=2.0, fourcc=None):
+    cap = cv2.VideoCapture(camera_info["index"], camera_info["backend_id"])
+    if not cap.isOpened():
+        cap.release()
+        return None
+
+    # ask the camera for the window size so frames don't need a software resize,
+    # MJPG lets many USB cameras deliver large frames at full frame rate
+    if fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    # wait for the first real frame instead of sleeping a fixed time
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        ret, frame = cap.read()
+        if ret and frame is not None:
+            if frame.shape[1::-1] != (width, height):
+                print(f"[INFO] Camera {camera_info['index']} delivers {frame.shape[1]}x{frame.shape[0]} "
+                      f"instead of {width}x{height}, frames will be resized")
+            return cap
+        time.sleep(0.02)
+    cap.release()
+    return None
+
+
+class CameraSwitcher:
+    def __init__(self, cameras, width, height, prewarm=True, fourcc=None, prewarm_timeout=30.0):
+        self.cameras = cameras
+        self.width = width
+        self.height = height
+        self.fourcc = fourcc
+        self.prewarm_enabled = prewarm
+        self.prewarm_timeout = prewarm_timeout
+        self._lock = threading.Lock()
+        # camera_idx -> (cap, time it was opened)
+        self._warm = {}
+        self._releasing = {}
+        self._ready = None
+        self._requested = None
+        self._opening = set()
+        self.failed = []
+
+    def request(self, camera_idx):
+        with self._lock:
+            self._requested = camera_idx
+            cap, _ = self._warm.pop(camera_idx, (None, None))
+            opening = camera_idx in self._opening
+            if cap is None and not opening:
+                self._opening.add(camera_idx)
+        if cap is not None:
+            self._finish(camera_idx, cap)
+        elif not opening:
+            threading.Thread(target=self._open, args=(camera_idx,), name="camera-switch", daemon=True).start()
+
+    def poll(self):
+        now = time.time()
+        with self._lock:
+            ready = self._ready
+            self._ready = None
+            # a prewarmed camera nobody switched to shouldn't stay open for the whole session
+            expired = [camera_idx for camera_idx, (_, opened) in self._warm.items()
+                       if now - opened > self.prewarm_timeout]
+            for camera_idx in expired:
+                self.release(self._warm.pop(camera_idx)[0], camera_idx)
+        return ready
+
+    def release(self, cap, camera_idx):
+        # releasing can take a while on some drivers, opening the same camera waits for it in _open
+        thread = threading.Thread(target=cap.release, name="camera-release", daemon=True)
+        self._releasing[camera_idx] = thread
+        thread.start()
+
+    def prewarm(self, current_idx):
+        if not self.prewarm_enabled or len(self.cameras) < 2:
+            return
+        next_idx = (current_idx + 1) % len(self.cameras)
+        with self._lock:
+            for camera_idx in list(self._warm):
+                if camera_idx != next_idx:
+                    self.release(self._warm.pop(camera_idx)[0], camera_idx)
+            if next_idx in self._warm or next_idx in self._opening:
+                return
+            self._opening.add(next_idx)
+        threading.Thread(target=self._open, args=(next_idx, True), name="camera-prewarm", daemon=True).start()
+
+    def close(self):
+        with self._lock:
+            for cap, _ in self._warm.values():
+                cap.release()
+            self._warm.clear()
+            if self._ready is not None:
+                self._ready[0].release()
+                self._ready = None
+
+    def _open(self, camera_idx, warm_only=False):
+        releasing = self._releasing.pop(camera_idx, None)
+        if releasing is not None:
+            releasing.join()
+        try:
+            cap = open_camera(self.cameras[camera_idx], self.width, self.height, fourcc=self.fourcc)
+        finally:
+            with self._lock:
+                self._opening.discard(camera_idx)
+        if cap is None:
+            # a failed prewarm is only a hint, the camera counts as broken when a switch to it fails
+            if self._requested == camera_idx or not warm_only:
+                print(f"[WARNING] Could not switch to camera {self.cameras[camera_idx]['index']}")
+                self.failed.append(camera_idx)
+            return
+        if warm_only:
+            with self._lock:
+                if self._requested != camera_idx:
+                    self._warm[camera_idx] = (cap, time.time())
+                    return
+        self._finish(camera_idx, cap)
+
+    def _finish(self, camera_idx, cap):
+        with self._lock:
+            if self._requested != camera_idx:
+                cap.release()
+                return
+            if self._ready is not None:
+                self._ready[0].release()
+            self._ready = (cap, camera_idx)
+            self._requested = None
@@ -0,0 +1,109 @@
+import random
+
+import numpy as np
+
+from collision import CollisionField
+
+class CoinsGame:
+    def __init__(self, width, height, seed=None, tick_rate=60, balls=1, ball_speed=90.0, ball_radius=20,
+                 coin_radius=25, spawn_interval=2.0, restart_delay=5.0, max_steps=10):
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.dt = 1.0 / tick_rate
+        self.ball_speed = ball_speed
+        self.ball_radius = ball_radius
+        self.coin_radius = coin_radius
+        self.spawn_interval = spawn_interval
+        self.restart_delay = restart_delay
+        # frames later than this many ticks are dropped instead of caught up, so a stall can't snowball
+        self.max_steps = max_steps
+
+        self.field = CollisionField(balls=balls)
+        # one row per ball: x, y, vx, vy
+        self.balls = np.zeros((balls, 4), dtype=np.float64)
+        self._bounds = np.array([width - ball_radius, height - ball_radius], dtype=np.float64)
+        self.hands = set()
+        self.accumulator = 0.0
+        self.last_timestamp = None
+        self.time = 0.0
+        self.ticks = 0
+        self.skipped_ticks = 0
+        self.restart()
+
+    def restart(self):
+        self.score = 0
+        self.game_over = False
+        self.restart_at = None
+        self.next_spawn = self.time + self.spawn_interval
+        self.field.clear()
+        count = len(self.balls)
+        self.balls[:, 0] = [self.width * (i + 1) // (count + 1) for i in range(count)]
+        self.balls[:, 1] = 25
+        self.balls[:, 2] = [self.rng.choice((-1, 1)) * self.ball_speed for _ in range(count)]
+        self.balls[:, 3] = self.ball_speed
+
+    def spawn_coin(self):
+        x = self.rng.randint(30, self.width - 30)
+        y = self.rng.randint(30, self.height - 30)
+        self.field.add_coin(x, y, self.coin_radius)
+
+    def update(self, elapsed):
+        # runs as many fixed ticks as fit in the elapsed time, the remainder carries to the next frame
+        self.accumulator += elapsed
+        steps = 0
+        while self.accumulator >= self.dt:
+            if steps == self.max_steps:
+                skipped = int(self.accumulator / self.dt)
+                self.skipped_ticks += skipped
+                self.accumulator -= skipped * self.dt
+                break
+            self.step()
+            self.accumulator -= self.dt
+            steps += 1
+        return steps
+
+    def advance(self, timestamp):
+        # driven by frame timestamps, so a replayed session steps exactly like the live one
+        elapsed = 0.0 if self.last_timestamp is None else max(0.0, timestamp - self.last_timestamp)
+        self.last_timestamp = timestamp
+        return self.update(elapsed)
+
+    def step(self):
+        self.time += self.dt
+        self.ticks += 1
+        if self.game_over:
+            if self.time >= self.restart_at:
+                self.restart()
+            return
+
+        positions = self.balls[:, :2]
+        velocities = self.balls[:, 2:]
+        positions += velocities * self.dt
+        bounce = (positions <= self.ball_radius) | (positions >= self._bounds)
+        if bounce.any():
+            velocities[bounce] = -velocities[bounce]
+            np.clip(positions, self.ball_radius, self._bounds, out=positions)
+
+        if self.time >= self.next_spawn:
+            self.spawn_coin()
+            self.next_spawn += self.spawn_interval
+
+    def collide(self, points):
+        if self.game_over:
+            return 0
+        self.field.set_balls(self.balls[:, :2].astype(int), self.ball_radius)
+        collected, ball_hit = self.field.collide(points)
+        self.score += collected
+        if ball_hit:
+            self.game_over = True
+            self.restart_at = self.time + self.restart_delay
+        return collected
+
+    def restart_remaining(self):
+        return max(0.0, self.restart_at - self.time) if self.game_over else 0.0
+
+    def state_hash(self):
+        # for checking that two runs with the same seed and inputs stayed in step
+        return hash((self.ticks, self.score, self.game_over, self.balls.tobytes(), self.field.coins.tobytes()))
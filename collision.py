@@ -0,0 +1,51 @@
+import numpy as np
+
+class CollisionField:
+    def __init__(self, capacity=64, balls=1):
+        # rows 0..balls-1 hold the balls, the coins follow them, columns are x, y, radius
+        self.balls = balls
+        self._circles = np.zeros((capacity + balls, 3), dtype=np.float64)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def coins(self):
+        return self._circles[self.balls:self.balls + self.count]
+
+    def set_ball(self, x, y, radius, index=0):
+        self._circles[index] = (x, y, radius)
+
+    def set_balls(self, positions, radius):
+        self._circles[:self.balls, :2] = positions
+        self._circles[:self.balls, 2] = radius
+
+    def add_coin(self, x, y, radius):
+        if self.balls + self.count >= len(self._circles):
+            grown = np.zeros((2 * len(self._circles), 3), dtype=np.float64)
+            grown[:len(self._circles)] = self._circles
+            self._circles = grown
+        self._circles[self.balls + self.count] = (x, y, radius)
+        self.count += 1
+
+    def clear(self):
+        self.count = 0
+
+    def collide(self, points):
+        if len(points) == 0:
+            return 0, False
+
+        circles = self._circles[:self.balls + self.count]
+        dx = points[:, 0, np.newaxis] - circles[:, 0]
+        dy = points[:, 1, np.newaxis] - circles[:, 1]
+        hits = (dx * dx + dy * dy < circles[:, 2] * circles[:, 2]).any(axis=0)
+
+        ball_hit = bool(hits[:self.balls].any())
+        coin_hits = hits[self.balls:]
+        collected = int(coin_hits.sum())
+        if collected:
+            remaining = self.coins[~coin_hits]
+            self.count = len(remaining)
+            self._circles[self.balls:self.balls + self.count] = remaining
+        return collected, ball_hit
@@ -0,0 +1,135 @@
+import numpy as np
+
+class PerformanceGovernor:
+    def __init__(self, target_fps=24, latency_budget_ms=None, min_scale=0.4, max_scale=1.0,
+                 scale_step=0.1, max_stride=4, model_complexity=1, min_model_complexity=0,
+                 adjust_interval=15, interpolate=True):
+        if latency_budget_ms:
+            self.budget = latency_budget_ms / 1000.0
+        else:
+            self.budget = 1.0 / target_fps
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.scale_step = scale_step
+        self.max_stride = max(1, int(max_stride))
+        self.max_model_complexity = model_complexity
+        self.min_model_complexity = min(min_model_complexity, model_complexity)
+        self.adjust_interval = adjust_interval
+        self.interpolate = interpolate
+
+        self.scale = max_scale
+        self.stride = 1
+        self.model_complexity = model_complexity
+        self.frame_time = None
+        self.infer_time = None
+        self.skip_time = None
+        self.frames = 0
+        self.inferred_frames = 0
+        self._frames_since_adjust = 0
+        self._frames_since_inference = 0
+        self._last = None
+        self._previous = None
+
+    def should_infer(self):
+        return self._last is None or self._frames_since_inference + 1 >= self.stride
+
+    def inference_size(self, width, height):
+        return max(32, int(width * self.scale)), max(32, int(height * self.scale))
+
+    def record_arrays(self, landmarks, is_right):
+        self._previous = self._last
+        self._last = (landmarks, is_right, self._frames_since_inference + 1)
+        self._frames_since_inference = 0
+
+    def predict_arrays(self):
+        self._frames_since_inference += 1
+        landmarks, is_right, frames = self._last
+        if not self.interpolate or self._previous is None or not len(landmarks):
+            return landmarks, is_right
+
+        previous, previous_right, _ = self._previous
+        if previous.shape != landmarks.shape or not np.array_equal(previous_right, is_right):
+            return landmarks, is_right
+
+        # extrapolate along the motion between the last two inferred frames
+        t = self._frames_since_inference / frames
+        return landmarks + (landmarks - previous) * t, is_right
+
+    def frame_done(self, duration, inferred):
+        self.frames += 1
+        if inferred:
+            self.inferred_frames += 1
+            self.infer_time = self._smooth(self.infer_time, duration)
+        else:
+            self.skip_time = self._smooth(self.skip_time, duration)
+        if self.infer_time is None:
+            return False
+        self.frame_time = self.expected_frame_time(self.stride)
+
+        self._frames_since_adjust += 1
+        if self._frames_since_adjust < self.adjust_interval:
+            return False
+        self._frames_since_adjust = 0
+
+        previous_complexity = self.model_complexity
+        if self.frame_time > self.budget * 1.05:
+            changed = self._degrade()
+        elif self.stride > 1:
+            changed = self.expected_frame_time(self.stride - 1) < self.budget * 0.9
+            if changed:
+                self.stride -= 1
+        elif self.frame_time < self.budget * 0.7:
+            changed = self._upgrade()
+        else:
+            changed = False
+
+        if changed:
+            print(f"[GOVERNOR] {self.describe()}")
+            # measure the new settings from scratch
+            self.infer_time = None
+            self.skip_time = None
+        return self.model_complexity != previous_complexity
+
+    def expected_frame_time(self, stride):
+        skip_time = self.skip_time if self.skip_time is not None else 0.0
+        return (self.infer_time + (stride - 1) * skip_time) / stride
+
+    def _smooth(self, average, value):
+        if average is None:
+            return value
+        return 0.9 * average + 0.1 * value
+
+    def _degrade(self):
+        if self.scale - self.scale_step >= self.min_scale - 1e-9:
+            self.scale = round(self.scale - self.scale_step, 3)
+        elif self.model_complexity > self.min_model_complexity:
+            self.model_complexity -= 1
+        elif self.stride < self.max_stride:
+            self.stride += 1
+        else:
+            return False
+        return True
+
+    def _upgrade(self):
+        if self.model_complexity < self.max_model_complexity:
+            self.model_complexity += 1
+        elif self.scale + self.scale_step <= self.max_scale + 1e-9:
+            self.scale = round(self.scale + self.scale_step, 3)
+        else:
+            return False
+        return True
+
+    def describe(self):
+        fps = 1.0 / self.frame_time if self.frame_time else 0.0
+        return (f"scale {self.scale:.2f}, stride {self.stride}, complexity {self.model_complexity}, "
+                f"{fps:.1f} FPS (budget {1.0 / self.budget:.1f} FPS)")
+
+    def stats(self):
+        return {
+            "scale": self.scale,
+            "stride": self.stride,
+            "model_complexity": self.model_complexity,
+            "frames": self.frames,
+            "inferred_frames": self.inferred_frames,
+            "frame_time_ms": 1000 * self.frame_time if self.frame_time else 0.0
+        }
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+NUM_LANDMARKS = 21
+
+WRIST = 0
+FINGER_TIPS = np.array([4, 8, 12, 16, 20])
+FINGER_PIPS = np.array([3, 6, 10, 14, 18])
+FINGER_MCPS = np.array([2, 5, 9, 13, 17])
+
+# same skeleton as mp.solutions.hands.HAND_CONNECTIONS
+HAND_CONNECTIONS = np.array([
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20)
+])
+
+def empty_landmarks():
+    return np.zeros((0, NUM_LANDMARKS, 3), dtype=np.float32), np.zeros(0, dtype=bool)
+
+def landmarks_to_array(landmarks):
+    return np.array([(lm.x, lm.y, lm.z) for lm in landmarks], dtype=np.float32)
+
+def results_to_arrays(results):
+    if not results.multi_hand_landmarks:
+        return empty_landmarks()
+
+    landmarks = np.array([[(lm.x, lm.y, lm.z) for lm in hand.landmark]
+                          for hand in results.multi_hand_landmarks], dtype=np.float32)
+    # detection runs on the unflipped camera frame, mirror x to match the flipped display
+    landmarks[:, :, 0] = 1.0 - landmarks[:, :, 0]
+    is_right = np.array([handedness.classification[0].label == "Right"
+                         for handedness in results.multi_handedness], dtype=bool)
+    return landmarks, is_right
+
+def finger_states_batch(landmarks, is_right):
+    x = landmarks[:, :, 0]
+    y = landmarks[:, :, 1]
+
+    states = y[:, FINGER_TIPS] < y[:, FINGER_PIPS]
+
+    thumb_tip_x = x[:, FINGER_TIPS[0]]
+    thumb_ip_x = x[:, FINGER_PIPS[0]]
+    thumb_out = np.where(is_right, thumb_tip_x > thumb_ip_x, thumb_tip_x < thumb_ip_x)
+    thumb_up = states[:, 0] & (y[:, FINGER_TIPS[0]] < y[:, FINGER_MCPS[0]])
+    states[:, 0] = thumb_out | thumb_up
+    return states
+
+def count_fingers_batch(landmarks, is_right):
+    return finger_states_batch(landmarks, is_right).sum(axis=1)
+
+def landmarks_to_pixels(landmarks, width, height):
+    return (landmarks[:, :, :2] * np.array([width, height], dtype=np.float64)).astype(np.int32)
+
+def arrays_to_results(landmarks, is_right):
+    # same shape as the MediaPipe results, without needing MediaPipe to replay a recording
+    if len(landmarks) == 0:
+        return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+
+    # inverse of results_to_arrays: back to the unflipped camera frame
+    camera = landmarks.astype(np.float64)
+    camera[:, :, 0] = 1.0 - camera[:, :, 0]
+    return SimpleNamespace(
+        multi_hand_landmarks=[SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in hand])
+                              for hand in camera.tolist()],
+        multi_handedness=[SimpleNamespace(classification=[SimpleNamespace(label="Right" if right else "Left",
+                                                                          score=1.0)])
+                          for right in is_right.tolist()]
+    )
@@ -1,12 +1,28 @@
+import time
+LAUNCH_TIME = time.perf_counter()
+
 import cv2
-import mediapipe as mp
 import numpy as np
-import time
 import json
 import os
-import pygame
 import threading
-import random
+from pipeline import FramePipeline, format_stats
+from synth import AudioEngine, load_pygame
+from coins import CoinsGame
+from roi_tracking import RoiTracker
+from governor import PerformanceGovernor
+from profiler import NULL_PROFILER, StageProfiler, ProfilerExporter, format_summary
+from cameras import (scan_cameras, load_camera_cache, save_camera_cache, invalidate_camera_cache,
+                     open_camera, CameraSwitcher)
+from multicam import run_multi_camera
+from stream_server import LandmarkStreamServer
+from recording import SessionRecorder
+from tracking import HandTracker, FINGER_DOWN, HAND_ENTERED, HAND_LEFT
+from landmarks import (results_to_arrays, landmarks_to_array, finger_states_batch,
+                       landmarks_to_pixels)
+from preprocess import FramePreprocessor
+from overlay import HudCache, text_size, draw_skeletons
+from backends import DEFAULT_OPTIONS, open_backend
 
 CONFIG_FILE = "config.json"
 
@@ -16,9 +32,107 @@ def load_config():
             "piano_game": False,
             "coins_game": False
         },
-        "gpu_mode": False,
         "window_width": 960,
-        "window_height": 720
+        "window_height": 720,
+        "inference": dict(DEFAULT_OPTIONS, backend="solutions"),
+        "pipeline": {
+            "policy": "latest",
+            "queue_size": 2,
+            "show_stats": False
+        },
+        "roi_tracking": {
+            "enabled": False,
+            "keyframe_interval": 10,
+            "padding": 0.25,
+            "min_confidence": 0.7
+        },
+        "governor": {
+            "enabled": False,
+            "target_fps": 24,
+            "latency_budget_ms": None,
+            "min_scale": 0.4,
+            "max_scale": 1.0,
+            "max_stride": 4,
+            "model_complexity": 1,
+            "interpolate": True
+        },
+        "camera": {
+            "preferred_index": None,
+            "max_index": 10,
+            "probe_timeout": 3.0,
+            "first_camera_timeout": 15.0,
+            "cache_file": "cameras_cache.json",
+            "prewarm": True,
+            "prewarm_timeout": 30.0,
+            "fourcc": None
+        },
+        "multi_camera": {
+            "enabled": False,
+            "workers": 2,
+            "schedule": "round_robin",
+            "priorities": {},
+            "static_image_mode": True,
+            "tile_width": 480,
+            "tile_height": 360,
+            "headless": False,
+            "output_dir": None
+        },
+        "profiler": {
+            "enabled": False,
+            "overlay": True,
+            "window": 300,
+            "export_path": None,
+            "export_interval": 5.0,
+            "prometheus_port": None
+        },
+        "stream_server": {
+            "enabled": False,
+            "host": "127.0.0.1",
+            "port": 8765,
+            "unix_socket": None,
+            "websocket_port": None,
+            "encoding": "binary",
+            "queue_size": 4
+        },
+        "tracking": {
+            "smoothing": True,
+            "min_cutoff": 1.0,
+            "beta": 5.0,
+            "d_cutoff": 1.0,
+            "debounce_frames": 2,
+            "handedness_frames": 3,
+            "max_distance": 0.2,
+            "max_missed": 5
+        },
+        "recording": {
+            "enabled": False,
+            "path": "recordings/session_%Y%m%d_%H%M%S.hlrec",
+            "max_hands": 2,
+            "chunk_frames": 256
+        },
+        "render": {
+            "headless": False,
+            "draw_landmarks": True
+        },
+        "audio": {
+            "sample_rate": 22050,
+            "buffer_size": 512,
+            "voices": 8,
+            "queue_size": 32,
+            "note_duration": 0.2
+        },
+        "coins": {
+            "seed": None,
+            "tick_rate": 60,
+            "balls": 1,
+            "ball_speed": 90.0,
+            "spawn_interval": 2.0,
+            "restart_delay": 5.0
+        },
+        "startup": {
+            "warmup": True,
+            "log_path": None
+        }
     }
     
     if os.path.exists(CONFIG_FILE):
@@ -31,78 +145,190 @@ def load_config():
                             "piano_game": user_config.pop("piano_game", False),
                             "coins_game": user_config.pop("coins_game", False)
                         }
-                default_config.update(user_config)
-                if "GAMES" in user_config:
-                    default_config["GAMES"].update(user_config["GAMES"])
+                if "gpu_mode" in user_config:
+                    # gpu_mode only changed a log line, it now picks the delegate of the Tasks backends
+                    gpu_mode = user_config.pop("gpu_mode")
+                    user_config.setdefault("inference", {}).setdefault("delegate", "gpu" if gpu_mode else "xnnpack")
+                for key, value in user_config.items():
+                    if isinstance(value, dict) and isinstance(default_config.get(key), dict):
+                        default_config[key].update(value)
+                    else:
+                        default_config[key] = value
                 print(f"[OK] Configuration loaded from {CONFIG_FILE}")
         except Exception as e:
             print(f"[WARNING] Error loading configuration: {e}")
             print("[INFO] Using default configuration")
     else:
         print(f"[INFO] {CONFIG_FILE} not found, using default configuration")
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(default_config, f, indent=4, ensure_ascii=False)
-        print(f"[OK] Configuration file created: {CONFIG_FILE}")
     
     return default_config
 
+def create_config_file():
+    # only the app itself writes the file, importing main for replay or benchmarks leaves the folder alone
+    with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=4, ensure_ascii=False)
+    print(f"[OK] Configuration file created: {CONFIG_FILE}")
+
 config = load_config()
 WINDOW_WIDTH = config["window_width"]
 WINDOW_HEIGHT = config["window_height"]
 
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
+def initialize_hands(model_complexity=None):
+    # mediapipe is imported by the backend, so it isn't loaded until a model is needed
+    inference_config = config["inference"]
+    options = dict(inference_config)
+    if model_complexity is not None:
+        options["model_complexity"] = model_complexity
+    hands = open_backend(inference_config["backend"], options)
+    print(f"[INFO] Hand detection: {hands.describe()}, complexity {options['model_complexity']}, "
+          f"up to {options['max_num_hands']} hands")
+    return hands
+
+def initialize_profiler():
+    profiler_config = config["profiler"]
+    if not profiler_config["enabled"]:
+        return NULL_PROFILER
+    print("[INFO] Profiler enabled")
+    return StageProfiler(window=profiler_config["window"])
+
+profiler = initialize_profiler()
+
+def initialize_governor():
+    governor_config = config["governor"]
+    if not governor_config["enabled"]:
+        return None
+    governor = PerformanceGovernor(
+        target_fps=governor_config["target_fps"],
+        latency_budget_ms=governor_config["latency_budget_ms"],
+        min_scale=governor_config["min_scale"],
+        max_scale=governor_config["max_scale"],
+        max_stride=governor_config["max_stride"],
+        model_complexity=governor_config["model_complexity"],
+        interpolate=governor_config["interpolate"]
+    )
+    print(f"[INFO] Performance governor enabled ({governor.describe()})")
+    return governor
+
+governor = initialize_governor()
+hands = None
+
+def initialize_roi_tracker(full_hands):
+    tracking_config = config["roi_tracking"]
+    if not tracking_config["enabled"]:
+        return None
+    crop_hands = open_backend(config["inference"]["backend"], config["inference"], static_image_mode=True, max_num_hands=1)
+    print(f"[INFO] ROI tracking enabled (keyframe every {tracking_config['keyframe_interval']} frames)")
+    return RoiTracker(full_hands, crop_hands,
+                      keyframe_interval=tracking_config["keyframe_interval"],
+                      padding=tracking_config["padding"],
+                      min_confidence=tracking_config["min_confidence"])
 
-def initialize_hands():
+roi_tracker = None
+model_loader = None
+startup = {}
+
+def mark_startup(phase):
+    startup.setdefault(phase, time.perf_counter() - LAUNCH_TIME)
+
+def load_model(warmup=False):
+    global hands, roi_tracker
+    new_hands = initialize_hands(governor.model_complexity if governor else None)
+    roi_tracker = initialize_roi_tracker(new_hands)
+    if warmup:
+        # the first process() call sets up the graph, pay for it before the camera delivers frames
+        new_hands.process(np.zeros((WINDOW_HEIGHT, WINDOW_WIDTH, 3), dtype=np.uint8))
+    hands = new_hands
+    mark_startup("model_ready")
+
+def warm_model():
     try:
-        hands = mp_hands.Hands(
-            static_image_mode=False
-        )
-        mode = "GPU" if config["gpu_mode"] else "CPU"
-        print(f"[INFO] MediaPipe Hands initialized (mode {mode})")
-        return hands
+        load_model(warmup=config["startup"]["warmup"])
     except Exception as e:
-        print(f"[WARNING] Error initializing MediaPipe: {e}")
-        hands = mp_hands.Hands(
-            static_image_mode=False
-        )
-        return hands
+        print(f"[WARNING] Model warm-up failed: {e}")
+
+def start_model_warmup():
+    global model_loader
+    model_loader = threading.Thread(target=warm_model, name="model-warmup", daemon=True)
+    model_loader.start()
+
+def report_startup():
+    mark_startup("first_frame")
+    phases = sorted((seconds, phase) for phase, seconds in startup.items() if phase != "first_frame")
+    print(f"[STATS] Startup: first frame {startup['first_frame']:.2f}s after launch ("
+          + ", ".join(f"{phase.replace('_', ' ')} at {seconds:.2f}s" for seconds, phase in phases) + ")")
+    log_path = config["startup"]["log_path"]
+    if log_path:
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                                **{phase: round(seconds, 4) for phase, seconds in startup.items()}}) + "\n")
+
+def wait_for_model():
+    if hands is None and model_loader is not None:
+        model_loader.join()
+    if hands is None:
+        # not started, or the warm-up thread failed: load here so any error surfaces
+        load_model()
+    return hands
+
+def initialize_hand_tracker():
+    tracking_config = config["tracking"]
+    smoothing = None
+    if tracking_config["smoothing"]:
+        smoothing = {
+            "min_cutoff": tracking_config["min_cutoff"],
+            "beta": tracking_config["beta"],
+            "d_cutoff": tracking_config["d_cutoff"]
+        }
+    return HandTracker(smoothing=smoothing,
+                       debounce_frames=tracking_config["debounce_frames"],
+                       handedness_frames=tracking_config["handedness_frames"],
+                       max_distance=tracking_config["max_distance"],
+                       max_missed=tracking_config["max_missed"])
 
-hands = initialize_hands()
+hand_tracker = initialize_hand_tracker()
+stream_server = None
+recorder = None
+hud = HudCache()
+preprocessor = FramePreprocessor(WINDOW_WIDTH, WINDOW_HEIGHT)
+
+audio_engine = None
 
 def init_piano():
+    global audio_engine
     if config["GAMES"]["piano_game"]:
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        audio_config = config["audio"]
+        pygame = load_pygame()
+        audio_engine = AudioEngine(piano_notes,
+                                   duration=audio_config["note_duration"],
+                                   sample_rate=audio_config["sample_rate"],
+                                   buffer_size=audio_config["buffer_size"],
+                                   voices=audio_config["voices"],
+                                   queue_size=audio_config["queue_size"])
+        try:
+            audio_engine.start()
+        except pygame.error as e:
+            print(f"[WARNING] Could not start audio: {e}")
+            audio_engine = None
+            return False
         return True
     return False
 
-def generate_tone(frequency, duration=0.2, sample_rate=22050):
-    frames = int(duration * sample_rate)
-    arr = np.zeros((frames, 2), dtype=np.int16)
-    max_sample = 2**(16 - 1) - 1
-    
-    for i in range(frames):
-        t = float(i) / sample_rate
-        wave = 4096 * np.sin(2 * np.pi * frequency * t)
-        envelope = 1.0
-        if i < frames * 0.1:
-            envelope = i / (frames * 0.1)
-        elif i > frames * 0.7:
-            envelope = 1.0 - ((i - frames * 0.7) / (frames * 0.3))
-        wave *= envelope
-        arr[i][0] = int(np.clip(wave, -max_sample, max_sample))
-        arr[i][1] = int(np.clip(wave, -max_sample, max_sample))
-    return arr
-
-def play_note(frequency, duration=0.2):
-    if not config["GAMES"]["piano_game"]:
+def close_piano():
+    global audio_engine
+    if audio_engine is None:
         return
-    try:
-        tone = generate_tone(frequency, duration)
-        sound = pygame.sndarray.make_sound(tone)
-        sound.play()
-    except:
-        pass
+    audio_engine.stop()
+    stats = audio_engine.stats()
+    print(f"[INFO] Audio: played {stats['played']}/{stats['triggered']} notes, "
+          f"{stats['dropped']} dropped, {stats['stolen']} voices stolen, "
+          f"queue latency p50 {stats['queue_latency_p50_ms']:.2f} ms / p99 {stats['queue_latency_p99_ms']:.2f} ms "
+          f"+ {stats['buffer_latency_ms']:.1f} ms mixer buffer")
+    audio_engine = None
+
+def play_note(frequency):
+    if not config["GAMES"]["piano_game"] or audio_engine is None:
+        return
+    audio_engine.trigger(frequency)
 
 piano_notes = {
     "right": {
@@ -121,109 +347,60 @@ piano_notes = {
     }
 }
 
-previous_finger_states = {}
+def on_piano_event(event):
+    play_note(piano_notes[event["hand"]][event["finger"]])
 
-def init_coins_game():
-    return {
-        "score": 0,
-        "coins": [],
-        "ball": {"x": WINDOW_WIDTH // 2, "y": 25, "vx": random.choice([-3, 3]), "vy": 3, "radius": 20},
-        "game_over": False,
-        "restart_time": None,
-        "last_coin_spawn": time.time()
-    }
+hand_tracker.subscribe(on_piano_event, (FINGER_DOWN,))
 
-def spawn_coin():
-    return {
-        "x": random.randint(30, WINDOW_WIDTH - 30),
-        "y": random.randint(30, WINDOW_HEIGHT - 30),
-        "radius": 25,
-        "collected": False
-    }
+def init_coins_game():
+    coins_config = config["coins"]
+    game = CoinsGame(WINDOW_WIDTH, WINDOW_HEIGHT,
+                     seed=coins_config["seed"],
+                     tick_rate=coins_config["tick_rate"],
+                     balls=coins_config["balls"],
+                     ball_speed=coins_config["ball_speed"],
+                     spawn_interval=coins_config["spawn_interval"],
+                     restart_delay=coins_config["restart_delay"])
+    game.hands = {track.track_id for track in hand_tracker.active_tracks()}
+    return game
 
-def check_collision(point_x, point_y, obj_x, obj_y, obj_radius):
-    distance = np.sqrt((point_x - obj_x)**2 + (point_y - obj_y)**2)
-    return distance < obj_radius
+coins_game = None
 
-def update_ball(game_state):
-    if game_state["game_over"]:
+def on_coins_event(event):
+    if coins_game is None:
         return
-    
-    ball = game_state["ball"]
-    ball["x"] += ball["vx"]
-    ball["y"] += ball["vy"]
-    
-    if ball["x"] - ball["radius"] <= 0 or ball["x"] + ball["radius"] >= WINDOW_WIDTH:
-        ball["vx"] = -ball["vx"]
-        ball["x"] = max(ball["radius"], min(WINDOW_WIDTH - ball["radius"], ball["x"]))
-    
-    if ball["y"] - ball["radius"] <= 0 or ball["y"] + ball["radius"] >= WINDOW_HEIGHT:
-        ball["vy"] = -ball["vy"]
-        ball["y"] = max(ball["radius"], min(WINDOW_HEIGHT - ball["radius"], ball["y"]))
+    if event["type"] == HAND_ENTERED:
+        coins_game.hands.add(event["hand_id"])
+    else:
+        coins_game.hands.discard(event["hand_id"])
 
-coins_game_state = None
+hand_tracker.subscribe(on_coins_event, (HAND_ENTERED, HAND_LEFT))
 
 
 def get_finger_states(landmarks, is_right_hand=True):
-    finger_tips = [4, 8, 12, 16, 20]
-    finger_pips = [3, 6, 10, 14, 18]
-    finger_mcps = [2, 5, 9, 13, 17]
-    wrist = 0
-    
-    finger_states = [False] * 5
-    
-    thumb_tip = landmarks[4]
-    thumb_ip = landmarks[3]
-    thumb_mcp = landmarks[2]
-    
-    if is_right_hand:
-        finger_states[0] = thumb_tip.x > thumb_ip.x
-    else:
-        finger_states[0] = thumb_tip.x < thumb_ip.x
-    
-    if not finger_states[0]:
-        finger_states[0] = thumb_tip.y < thumb_ip.y and thumb_tip.y < thumb_mcp.y
-    
-    for i in range(1, 5):
-        finger_states[i] = landmarks[finger_tips[i]].y < landmarks[finger_pips[i]].y
-    
-    return finger_states
+    states = finger_states_batch(landmarks_to_array(landmarks)[np.newaxis], np.array([is_right_hand]))
+    return states[0].tolist()
 
 def count_fingers(landmarks, is_right_hand=True):
-    finger_states = get_finger_states(landmarks, is_right_hand)
-    return sum(finger_states)
+    return sum(get_finger_states(landmarks, is_right_hand))
 
 def detect_all_cameras():
-    available_cameras = []
-    backends = [
-        (cv2.CAP_DSHOW, "DirectShow"),
-        (cv2.CAP_MSMF, "Media Foundation"),
-        (cv2.CAP_V4L2, "V4L2"),
-        (cv2.CAP_ANY, "Any")
-    ]
-    
-    print("[INFO] Scanning for all available cameras...")
-    for camera_index in range(10):
-        for backend_id, backend_name in backends:
-            try:
-                test_cap = cv2.VideoCapture(camera_index, backend_id)
-                if test_cap.isOpened():
-                    ret, test_frame = test_cap.read()
-                    if ret and test_frame is not None:
-                        available_cameras.append({
-                            "index": camera_index,
-                            "backend_id": backend_id,
-                            "backend_name": backend_name
-                        })
-                        print(f"[OK] Camera {camera_index} found using {backend_name}")
-                        test_cap.release()
-                        break
-                else:
-                    test_cap.release()
-            except:
-                pass
-    
-    return available_cameras
+    camera_config = config["camera"]
+    cache_file = camera_config["cache_file"]
+    if cache_file:
+        cached_cameras = load_camera_cache(cache_file)
+        if cached_cameras:
+            return cached_cameras
+    
+    def on_complete(cameras):
+        if cache_file:
+            save_camera_cache(cache_file, cameras)
+    
+    return scan_cameras(max_index=camera_config["max_index"],
+                        timeout=camera_config["probe_timeout"],
+                        first_camera_timeout=camera_config["first_camera_timeout"],
+                        preferred_index=camera_config["preferred_index"],
+                        on_complete=on_complete)
 
 def switch_camera(camera_list, current_index, cap):
     if not camera_list or current_index >= len(camera_list):
@@ -231,28 +408,234 @@ def switch_camera(camera_list, current_index, cap):
     
     if cap is not None:
         cap.release()
-        time.sleep(0.2)
     
     camera_info = camera_list[current_index]
-    new_cap = cv2.VideoCapture(camera_info["index"], camera_info["backend_id"])
+    new_cap = open_camera(camera_info, WINDOW_WIDTH, WINDOW_HEIGHT, fourcc=config["camera"]["fourcc"])
     
-    if new_cap.isOpened():
-        new_cap.set(cv2.CAP_PROP_FRAME_WIDTH, WINDOW_WIDTH)
-        new_cap.set(cv2.CAP_PROP_FRAME_HEIGHT, WINDOW_HEIGHT)
-        new_cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-        time.sleep(0.3)
+    if new_cap is not None:
         print(f"[OK] Switched to camera {camera_info['index']} ({camera_info['backend_name']})")
         return new_cap, current_index
     else:
         print(f"[WARNING] Could not switch to camera {camera_info['index']}")
         return None, current_index
 
+def display_frame(frame):
+    # headless runs never show the frame, so there is nothing to flip or resize
+    if config["render"]["headless"]:
+        return None
+    start = profiler.now()
+    frame = preprocessor.display(frame)
+    profiler.record("resize", start)
+    return frame
+
+def preprocess_frame(frame, inference_size=None):
+    # inference reads the camera frame unmirrored, only the display copy is flipped;
+    # the model gets the window size as before, which needs no resize when the camera delivers it
+    display = display_frame(frame)
+    start = profiler.now()
+    rgb_frame = preprocessor.rgb(frame, inference_size or (WINDOW_WIDTH, WINDOW_HEIGHT))
+    profiler.record("cvtColor", start)
+    return display, rgb_frame
+
+def run_hands(rgb_frame):
+    if hands is None:
+        wait_for_model()
+    start = profiler.now()
+    if roi_tracker is not None:
+        results = roi_tracker.process(rgb_frame)
+    else:
+        results = hands.process(rgb_frame)
+    profiler.record("inference", start)
+    return results
+
+def rebuild_hands(model_complexity):
+    global hands
+    old_hands = hands
+    hands = initialize_hands(model_complexity)
+    if roi_tracker is not None:
+        roi_tracker.full_hands = hands
+    old_hands.close()
+
+def infer_frame(frame):
+    # returns the frame, the detection results and the landmark arrays when they are already known
+    if governor is None:
+        frame, rgb_frame = preprocess_frame(frame)
+        return frame, run_hands(rgb_frame), None
+    
+    start = time.perf_counter()
+    inferred = governor.should_infer()
+    results = None
+    if inferred:
+        frame, rgb_frame = preprocess_frame(frame, governor.inference_size(WINDOW_WIDTH, WINDOW_HEIGHT))
+        results = run_hands(rgb_frame)
+        arrays = results_to_arrays(results)
+        governor.record_arrays(*arrays)
+    else:
+        # skipped frames are predicted straight from the last two inferences' arrays
+        frame = display_frame(frame)
+        arrays = governor.predict_arrays()
+    
+    if governor.frame_done(time.perf_counter() - start, inferred):
+        rebuild_hands(governor.model_complexity)
+    return frame, results, arrays
+
+def create_multi_camera_hands():
+    return open_backend(config["inference"]["backend"], config["inference"],
+                        static_image_mode=config["multi_camera"]["static_image_mode"])
+
+def render_frame(frame, results, current_camera_idx, camera_count, draw=True, timestamp=None, arrays=None):
+    if timestamp is None:
+        timestamp = time.time()
+    
+    start = profiler.now()
+    if config["GAMES"]["coins_game"] and coins_game:
+        # the game moves in fixed ticks of its own, however fast frames arrive
+        was_over = coins_game.game_over
+        coins_game.advance(timestamp)
+        if was_over and not coins_game.game_over:
+            print("[INFO] Game restarted")
+        if draw and coins_game.game_over:
+            text = f"GAME OVER - Restarting in {int(coins_game.restart_remaining())}s"
+            (text_width, text_height), baseline = text_size(text, 1.5, 3)
+            text_x = (WINDOW_WIDTH - text_width) // 2
+            text_y = WINDOW_HEIGHT // 2
+            hud.add(text_x, text_y, ((text, (0, 0), 1.5, (0, 0, 255), 3),))
+        elif draw:
+            for coin_x, coin_y, coin_radius in coins_game.field.coins.astype(int).tolist():
+                cv2.circle(frame, (coin_x, coin_y), coin_radius, (0, 255, 255), -1)
+                cv2.circle(frame, (coin_x, coin_y), coin_radius, (255, 215, 0), 3)
+            
+            for ball_x, ball_y in coins_game.balls[:, :2].astype(int).tolist():
+                cv2.circle(frame, (ball_x, ball_y), coins_game.ball_radius, (0, 0, 0), -1)
+                cv2.circle(frame, (ball_x, ball_y), coins_game.ball_radius, (255, 255, 255), 2)
+            
+            score_text = f"Score: {coins_game.score}"
+            (text_width, text_height), baseline = text_size(score_text, 1.5, 3)
+            score_x = WINDOW_WIDTH - text_width - 20
+            score_y = 50
+            hud.add(score_x - 10, score_y - text_height - 10,
+                    ((score_text, (10, text_height + 10), 1.5, (255, 255, 255), 3),),
+                    box=(text_width + 20, text_height + 20, (0, 0, 0)))
+    game_time = profiler.now() - start
+    
+    # smoothing, stable hand ids and debounced fingers; the games react to the events it sends
+    start = profiler.now()
+    # replay and the governor already have the landmark arrays and skip the conversion
+    landmarks, is_right = arrays if arrays is not None else results_to_arrays(results)
+    if stream_server is not None:
+        stream_server.publish(landmarks, is_right, finger_states_batch(landmarks, is_right), timestamp)
+    if recorder is not None:
+        recorder.write(timestamp, landmarks, is_right)
+    
+    hand_tracker.update(landmarks, is_right, timestamp)
+    tracks = hand_tracker.active_tracks()
+    if tracks:
+        pixels = landmarks_to_pixels(np.stack([track.landmarks for track in tracks]), WINDOW_WIDTH, WINDOW_HEIGHT)
+    else:
+        pixels = np.zeros((0, 21, 2), dtype=np.int32)
+    profiler.record("tracking", start)
+    
+    start = profiler.now()
+    if draw and config["render"]["draw_landmarks"]:
+        draw_skeletons(frame, pixels)
+    profiler.record("landmarks", start)
+    
+    start = profiler.now()
+    if config["GAMES"]["coins_game"] and coins_game and not coins_game.game_over:
+        in_play = [idx for idx, track in enumerate(tracks) if track.track_id in coins_game.hands]
+        coins_game.collide(pixels[in_play].reshape(-1, 2))
+        if coins_game.game_over:
+            print("[GAME] Game Over! Score:", coins_game.score)
+    profiler.add("game", game_time + profiler.now() - start)
+    
+    # headless: nothing was drawn and no HUD is composed
+    if not draw:
+        return frame
+    
+    start = profiler.now()
+    total_fingers = sum(track.count for track in tracks)
+    hand_count = len(tracks)
+    
+    for track, hand_pixels in zip(tracks, pixels):
+        cx, cy = hand_pixels[0].tolist()
+        labels = ((f"{track.count} fingers", (-50, -30), 1, (0, 255, 0), 2),)
+        if config["GAMES"]["piano_game"]:
+            labels = ((track.hand.upper(), (-40, -60), 1.2, (255, 255, 0), 3),) + labels
+        hud.add(cx, cy, labels)
+    
+    if not config["GAMES"]["coins_game"]:
+        hud.add(10, 10, ((f"Total fingers: {total_fingers}", (10, 40), 1.5, (0, 255, 255), 3),
+                         (f"Hands: {hand_count}", (10, 75), 1, (255, 255, 0), 2)),
+                box=(390, 90, (0, 0, 0)))
+    
+    camera_info_text = f"Camera: {current_camera_idx + 1}/{camera_count}"
+    if camera_count > 1:
+        camera_info_text += " (d/a or arrows to switch)"
+    hud.add(10, WINDOW_HEIGHT - 80, ((camera_info_text, (5, 30), 0.6, (255, 255, 255), 2),),
+            box=(390, 70, (0, 0, 0)))
+    
+    if len(landmarks) == 0:
+        hud.add(10, WINDOW_HEIGHT - 20, (("No hands detected", (0, 0), 1, (0, 0, 255), 2),))
+    
+    if profiler.enabled and config["profiler"]["overlay"]:
+        add_profiler_overlay()
+    
+    hud.blend(frame)
+    profiler.record("hud", start)
+    
+    return frame
+
+profiler_overlay = {"lines": (), "updated": 0.0}
+
+def add_profiler_overlay():
+    if time.time() - profiler_overlay["updated"] > 0.5:
+        profiler_overlay["lines"] = tuple(format_summary(profiler.summary()))
+        profiler_overlay["updated"] = time.time()
+    lines = profiler_overlay["lines"]
+    if not lines:
+        return
+    line_height = 16
+    top = WINDOW_HEIGHT - 10 - line_height * len(lines) - 10
+    hud.add(410, top, tuple((line, (8, 20 + i * line_height), 0.45, (255, 255, 255), 1)
+                            for i, line in enumerate(lines)),
+            box=(350, WINDOW_HEIGHT - 10 - top, (0, 0, 0)))
+
+def find_camera(camera_list, camera_index):
+    for position, camera_info in enumerate(camera_list):
+        if camera_info["index"] == camera_index:
+            return position
+    return 0
+
+def apply_camera_switch(pipeline, camera_switcher, camera_list, previous_index):
+    switched = camera_switcher.poll()
+    if switched is None:
+        return None
+    new_cap, current_index = switched
+    old_cap = pipeline.detach_capture()
+    pipeline.attach_capture(new_cap)
+    if old_cap is not None:
+        camera_switcher.release(old_cap, previous_index)
+    camera_info = camera_list[current_index]
+    print(f"[OK] Switched to camera {camera_info['index']} ({camera_info['backend_name']})")
+    camera_switcher.prewarm(current_index)
+    return current_index
+
 def main():
+    mark_startup("main")
     print("=" * 60)
     print("Hand Detection - Finger Counter")
     print("=" * 60)
     
+    if not os.path.exists(CONFIG_FILE):
+        create_config_file()
+    
+    # the model loads while the cameras are searched and opened
+    multi_config = config["multi_camera"]
+    if not multi_config["enabled"]:
+        start_model_warmup()
+    
     available_cameras = detect_all_cameras()
+    mark_startup("cameras_found")
     
     if not available_cameras:
         print("\n[ERROR] No cameras found.")
@@ -264,255 +647,206 @@ def main():
     
     print(f"\n[INFO] Found {len(available_cameras)} camera(s) available")
     
-    current_camera_idx = 0
-    cap = None
-    cap, current_camera_idx = switch_camera(available_cameras, current_camera_idx, cap)
-    
-    if cap is None or not cap.isOpened():
-        print("\n[ERROR] Could not open webcam.")
+    if multi_config["enabled"]:
+        run_multi_camera(available_cameras, create_multi_camera_hands,
+                         WINDOW_WIDTH, WINDOW_HEIGHT,
+                         workers=multi_config["workers"],
+                         schedule=multi_config["schedule"],
+                         priorities={int(k): int(v) for k, v in multi_config["priorities"].items()},
+                         tile_size=(multi_config["tile_width"], multi_config["tile_height"]),
+                         headless=multi_config["headless"],
+                         output_dir=multi_config["output_dir"])
         return
     
-    ret, test_frame = cap.read()
-    if not ret or test_frame is None:
-        print("\n[WARNING] Camera opened but cannot read frames.")
-        print("Trying to reinitialize...")
-        cap.release()
-        time.sleep(1)
+    camera_config = config["camera"]
+    current_camera_idx = find_camera(available_cameras, camera_config["preferred_index"])
+    cap, current_camera_idx = switch_camera(available_cameras, current_camera_idx, None)
+    
+    if cap is None and camera_config["cache_file"] and os.path.exists(camera_config["cache_file"]):
+        print("\n[WARNING] Cached camera could not be opened, scanning again...")
+        invalidate_camera_cache(camera_config["cache_file"])
+        available_cameras = detect_all_cameras()
+        current_camera_idx = find_camera(available_cameras, camera_config["preferred_index"])
         cap, current_camera_idx = switch_camera(available_cameras, current_camera_idx, None)
-        if cap is None:
-            print("[ERROR] Could not reinitialize camera.")
-            return
-        time.sleep(0.5)
+    
+    if cap is None:
+        print("\n[ERROR] Could not open webcam.")
+        return
     
     print("[OK] Webcam initialized successfully!")
+    mark_startup("camera_open")
+    
+    camera_switcher = CameraSwitcher(available_cameras, WINDOW_WIDTH, WINDOW_HEIGHT,
+                                     prewarm=camera_config["prewarm"], fourcc=camera_config["fourcc"],
+                                     prewarm_timeout=camera_config["prewarm_timeout"])
+    camera_switcher.prewarm(current_camera_idx)
     
     piano_initialized = init_piano()
     if config["GAMES"]["piano_game"] and piano_initialized:
         print("[OK] Piano mode initialized")
     
-    cv2.namedWindow('Hand Detection', cv2.WINDOW_NORMAL)
-    cv2.resizeWindow('Hand Detection', WINDOW_WIDTH, WINDOW_HEIGHT)
+    # headless runs keep inference, games, streaming and recording but never draw or open a window
+    headless = config["render"]["headless"]
+    if not headless:
+        cv2.namedWindow('Hand Detection', cv2.WINDOW_NORMAL)
+        cv2.resizeWindow('Hand Detection', WINDOW_WIDTH, WINDOW_HEIGHT)
     
     print("\n" + "=" * 60)
     print("[OK] Application started successfully!")
     print("=" * 60)
     print(f"\n[CONFIG] Piano Game: {'Enabled' if config['GAMES']['piano_game'] else 'Disabled'}")
     print(f"[CONFIG] Coins Game: {'Enabled' if config['GAMES']['coins_game'] else 'Disabled'}")
-    print(f"[CONFIG] GPU: {'Enabled' if config['gpu_mode'] else 'Disabled (CPU)'}")
+    print(f"[CONFIG] Inference: {config['inference']['backend']} ({config['inference']['delegate']})")
     print("=" * 60)
     
-    global coins_game_state
+    global coins_game
     if config["GAMES"]["coins_game"]:
-        coins_game_state = init_coins_game()
+        coins_game = init_coins_game()
         print("[OK] Coins game initialized")
     print("\n[INFO] Show your hand to the camera")
     print("[CONTROLS]")
-    print("  - Press 'q' to quit")
-    if len(available_cameras) > 1:
+    if headless:
+        print("  - Press Ctrl+C to quit")
+    else:
+        print("  - Press 'q' to quit")
+    if len(available_cameras) > 1 and not headless:
         print("  - Press 'd' or RIGHT arrow to switch to next camera")
         print("  - Press 'a' or LEFT arrow to switch to previous camera")
         print("  - Press number keys (0-9) to select camera directly")
     print("")
     
-    consecutive_failures = 0
-    max_failures = 10
-    
-    while True:
-        ret, frame = cap.read()
-        
-        if not ret:
-            consecutive_failures += 1
-            if consecutive_failures >= max_failures:
-                print("\n[ERROR] Could not read frame from webcam after multiple attempts.")
+    pipeline_config = config["pipeline"]
+    pipeline = FramePipeline(cap, infer_frame,
+                             policy=pipeline_config["policy"],
+                             queue_size=pipeline_config["queue_size"],
+                             profiler=profiler)
+    pipeline.start()
+    
+    exporter = None
+    if profiler.enabled:
+        profiler_config = config["profiler"]
+        exporter = ProfilerExporter(profiler,
+                                    export_path=profiler_config["export_path"],
+                                    interval=profiler_config["export_interval"],
+                                    prometheus_port=profiler_config["prometheus_port"])
+        exporter.start()
+    
+    global stream_server
+    stream_config = config["stream_server"]
+    if stream_config["enabled"]:
+        stream_server = LandmarkStreamServer(host=stream_config["host"],
+                                             port=stream_config["port"],
+                                             unix_socket=stream_config["unix_socket"],
+                                             websocket_port=stream_config["websocket_port"],
+                                             encoding=stream_config["encoding"],
+                                             queue_size=stream_config["queue_size"])
+        stream_server.start()
+    
+    global recorder
+    recording_config = config["recording"]
+    if recording_config["enabled"]:
+        recorder = SessionRecorder(time.strftime(recording_config["path"]),
+                                   max_hands=recording_config["max_hands"],
+                                   chunk_frames=recording_config["chunk_frames"])
+        print(f"[INFO] Recording landmarks to {recorder.path}")
+    frame_start = profiler.now()
+    print(f"[INFO] Frame pipeline started (policy {pipeline.policy})")
+    
+    # headless runs can only be stopped with Ctrl+C, wherever it lands the cleanup below still runs
+    try:
+        while True:
+            item = pipeline.get_result(timeout=0.1)
+            
+            if pipeline.failed:
+                if pipeline.error is not None:
+                    print(f"\n[ERROR] Inference failed: {pipeline.error}")
+                else:
+                    print("\n[ERROR] Could not read frame from webcam after multiple attempts.")
                 print("Closing application...")
                 break
             
-            time.sleep(0.1)
-            continue
-        
-        consecutive_failures = 0
-        
-        frame = cv2.flip(frame, 1)
-        frame = cv2.resize(frame, (WINDOW_WIDTH, WINDOW_HEIGHT))
-        
-        if config["GAMES"]["coins_game"] and coins_game_state:
-            if coins_game_state["game_over"]:
-                if coins_game_state["restart_time"] is None:
-                    coins_game_state["restart_time"] = time.time()
-                elif time.time() - coins_game_state["restart_time"] >= 5.0:
-                    coins_game_state = init_coins_game()
-                    print("[INFO] Game restarted")
-                else:
-                    remaining = int(5 - (time.time() - coins_game_state["restart_time"]))
-                    text = f"GAME OVER - Restarting in {remaining}s"
-                    font = cv2.FONT_HERSHEY_SIMPLEX
-                    font_scale = 1.5
-                    thickness = 3
-                    (text_width, text_height), baseline = cv2.getTextSize(text, font, font_scale, thickness)
-                    text_x = (WINDOW_WIDTH - text_width) // 2
-                    text_y = WINDOW_HEIGHT // 2
-                    cv2.putText(frame, text, (text_x, text_y), font, font_scale, (0, 0, 255), thickness)
-            else:
-                update_ball(coins_game_state)
-                
-                if time.time() - coins_game_state["last_coin_spawn"] > 2.0:
-                    coins_game_state["coins"].append(spawn_coin())
-                    coins_game_state["last_coin_spawn"] = time.time()
-                
-                coins_game_state["coins"] = [coin for coin in coins_game_state["coins"] if not coin["collected"]]
-                for coin in coins_game_state["coins"]:
-                    cv2.circle(frame, (coin["x"], coin["y"]), coin["radius"], (0, 255, 255), -1)
-                    cv2.circle(frame, (coin["x"], coin["y"]), coin["radius"], (255, 215, 0), 3)
-                
-                ball = coins_game_state["ball"]
-                cv2.circle(frame, (int(ball["x"]), int(ball["y"])), ball["radius"], (0, 0, 0), -1)
-                cv2.circle(frame, (int(ball["x"]), int(ball["y"])), ball["radius"], (255, 255, 255), 2)
-                
-                score_text = f"Score: {coins_game_state['score']}"
-                font = cv2.FONT_HERSHEY_SIMPLEX
-                font_scale = 1.5
-                thickness = 3
-                (text_width, text_height), baseline = cv2.getTextSize(score_text, font, font_scale, thickness)
-                score_x = WINDOW_WIDTH - text_width - 20
-                score_y = 50
-                cv2.rectangle(frame, (score_x - 10, score_y - text_height - 10), 
-                            (score_x + text_width + 10, score_y + 10), (0, 0, 0), -1)
-                cv2.putText(frame, score_text, (score_x, score_y),
-                          font, font_scale, (255, 255, 255), thickness)
-        
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        results = hands.process(rgb_frame)
-        
-        total_fingers = 0
-        hand_count = 0
-        
-        if results.multi_hand_landmarks:
-            for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                hand_label = results.multi_handedness[idx].classification[0].label
-                inverted_label = "Left" if hand_label == "Right" else "Right"
-                is_right = inverted_label == "Right"
-                hand_key = "right" if is_right else "left"
-                
-                mp_drawing.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    mp_hands.HAND_CONNECTIONS,
-                    mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2),
-                    mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2)
-                )
-                
-                finger_states = get_finger_states(hand_landmarks.landmark, is_right)
-                fingers = sum(finger_states)
-                total_fingers += fingers
-                hand_count += 1
+            if item is not None:
+                frame = render_frame(item["frame"], item["results"], current_camera_idx, len(available_cameras),
+                                     draw=not headless, timestamp=item["timestamp"], arrays=item["arrays"])
                 
-                h, w, c = frame.shape
-                cx = int(hand_landmarks.landmark[0].x * w)
-                cy = int(hand_landmarks.landmark[0].y * h)
+                if pipeline_config["show_stats"] and not headless:
+                    cv2.putText(frame, format_stats(pipeline.stats()), (10, WINDOW_HEIGHT - 90),
+                              cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
                 
-                hand_id = f"{hand_key}_{idx}"
-                
-                if config["GAMES"]["piano_game"]:
-                    if hand_id not in previous_finger_states:
-                        previous_finger_states[hand_id] = finger_states.copy()
-                    else:
-                        for finger_idx in range(5):
-                            if previous_finger_states[hand_id][finger_idx] and not finger_states[finger_idx]:
-                                note_freq = piano_notes[hand_key][finger_idx]
-                                threading.Thread(target=play_note, args=(note_freq,), daemon=True).start()
-                        previous_finger_states[hand_id] = finger_states.copy()
-                    
-                    label_text = inverted_label.upper()
-                    cv2.putText(frame, label_text, (cx - 40, cy - 60),
-                              cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 0), 3)
-                
-                cv2.putText(frame, f"{fingers} fingers", (cx - 50, cy - 30),
-                          cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                
-                if config["GAMES"]["coins_game"] and coins_game_state and not coins_game_state["game_over"]:
-                    for landmark in hand_landmarks.landmark:
-                        px = int(landmark.x * w)
-                        py = int(landmark.y * h)
-                        
-                        for coin in coins_game_state["coins"][:]:
-                            if not coin.get("collected", False) and check_collision(px, py, coin["x"], coin["y"], coin["radius"]):
-                                coin["collected"] = True
-                                coins_game_state["score"] += 1
-                                coins_game_state["coins"].remove(coin)
-                                break
-                        
-                        if coins_game_state["game_over"]:
-                            break
-                        
-                        ball = coins_game_state["ball"]
-                        if check_collision(px, py, int(ball["x"]), int(ball["y"]), ball["radius"]):
-                            coins_game_state["game_over"] = True
-                            coins_game_state["restart_time"] = None
-                            print("[GAME] Game Over! Score:", coins_game_state["score"])
-                            break
-        
-        if config["GAMES"]["piano_game"]:
-            if results.multi_hand_landmarks:
-                active_hand_ids = set()
-                for idx in range(len(results.multi_hand_landmarks)):
-                    hand_label = results.multi_handedness[idx].classification[0].label
-                    inverted_label = "Left" if hand_label == "Right" else "Right"
-                    hand_key = "right" if inverted_label == "Right" else "left"
-                    active_hand_ids.add(f"{hand_key}_{idx}")
-                
-                for hand_id in list(previous_finger_states.keys()):
-                    if hand_id not in active_hand_ids:
-                        del previous_finger_states[hand_id]
-            else:
-                previous_finger_states.clear()
-        
-        if not config["GAMES"]["coins_game"]:
-            cv2.rectangle(frame, (10, 10), (400, 100), (0, 0, 0), -1)
-            cv2.putText(frame, f"Total fingers: {total_fingers}", (20, 50),
-                      cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 255, 255), 3)
-            cv2.putText(frame, f"Hands: {hand_count}", (20, 85),
-                      cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 0), 2)
-        
-        camera_info_text = f"Camera: {current_camera_idx + 1}/{len(available_cameras)}"
-        if len(available_cameras) > 1:
-            camera_info_text += " (d/a or arrows to switch)"
-        cv2.rectangle(frame, (10, WINDOW_HEIGHT - 80), (400, WINDOW_HEIGHT - 10), (0, 0, 0), -1)
-        cv2.putText(frame, camera_info_text, (15, WINDOW_HEIGHT - 50),
-                  cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-        
-        if not results.multi_hand_landmarks:
-            cv2.putText(frame, "No hands detected", (10, WINDOW_HEIGHT - 20),
-                      cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
-        
-        cv2.imshow('Hand Detection', frame)
-        
-        full_key = cv2.waitKey(1)
-        key = full_key & 0xFF
-        
-        if key == ord('q') or key == 27:
-            print("\n[QUIT] Quitting application...")
-            break
-        elif len(available_cameras) > 1:
-            if key == ord('d') or (full_key == 2555904):
-                current_camera_idx = (current_camera_idx + 1) % len(available_cameras)
-                cap, current_camera_idx = switch_camera(available_cameras, current_camera_idx, cap)
-            elif key == ord('a') or (full_key == 2424832):
-                current_camera_idx = (current_camera_idx - 1) % len(available_cameras)
-                cap, current_camera_idx = switch_camera(available_cameras, current_camera_idx, cap)
-            elif ord('0') <= key <= ord('9'):
-                camera_num = key - ord('0')
-                if camera_num < len(available_cameras):
-                    current_camera_idx = camera_num
-                    cap, current_camera_idx = switch_camera(available_cameras, current_camera_idx, cap)
-    
-    cap.release()
-    cv2.destroyAllWindows()
-    hands.close()
+                start = profiler.now()
+                if not headless:
+                    cv2.imshow('Hand Detection', frame)
+                    # imshow keeps its own copy, the buffer can take the next frame
+                    preprocessor.release(item["frame"])
+                if "first_frame" not in startup:
+                    report_startup()
+            
+            full_key = -1 if headless else cv2.waitKey(1)
+            key = full_key & 0xFF
+            
+            if item is not None:
+                if not headless:
+                    profiler.record("imshow", start)
+                profiler.record("frame", frame_start)
+                frame_start = profiler.now()
+            
+            switched_idx = apply_camera_switch(pipeline, camera_switcher, available_cameras, current_camera_idx)
+            if switched_idx is not None:
+                current_camera_idx = switched_idx
+            
+            if key == ord('q') or key == 27:
+                print("\n[QUIT] Quitting application...")
+                break
+            elif len(available_cameras) > 1:
+                if key == ord('d') or (full_key == 2555904):
+                    camera_switcher.request((current_camera_idx + 1) % len(available_cameras))
+                elif key == ord('a') or (full_key == 2424832):
+                    camera_switcher.request((current_camera_idx - 1) % len(available_cameras))
+                elif ord('0') <= key <= ord('9'):
+                    camera_num = key - ord('0')
+                    if camera_num < len(available_cameras):
+                        camera_switcher.request(camera_num)
+    except KeyboardInterrupt:
+        print("\n[QUIT] Interrupted")
+    
+    pipeline.stop()
+    camera_switcher.close()
+    if camera_switcher.failed and camera_config["cache_file"]:
+        invalidate_camera_cache(camera_config["cache_file"])
+    if exporter is not None:
+        exporter.stop()
+    if stream_server is not None:
+        stream_stats = stream_server.stats()
+        stream_server.stop()
+        print(f"[INFO] Landmark stream: published {stream_stats['published']} frames to "
+              f"{len(stream_stats['clients'])} connected subscriber(s)")
+    if recorder is not None:
+        recorder.close()
+        print(f"[OK] Recorded {recorder.frames} frames to {recorder.path} (replay with: python replay.py {recorder.path})")
+    stats = pipeline.stats()
+    print(f"[INFO] Pipeline stats: captured {stats['capture']['frames']} frames, "
+          f"dropped {stats['capture']['dropped']} before inference, "
+          f"{stats['inference']['dropped']} before render")
+    if roi_tracker is not None:
+        tracking = roi_tracker.stats()
+        print(f"[INFO] ROI tracking: {tracking['full_frame_inferences_saved']}/{tracking['frames']} full-frame inferences saved, "
+              f"{tracking['fallbacks']} fallbacks, {tracking['avg_latency_ms']:.1f} ms/frame "
+              f"(crop {tracking['roi_latency_ms']:.1f} ms, keyframe {tracking['keyframe_latency_ms']:.1f} ms)")
+        roi_tracker.crop_hands.close()
+    if governor is not None:
+        governor_stats = governor.stats()
+        print(f"[INFO] Governor: {governor.describe()}, inferred {governor_stats['inferred_frames']}/{governor_stats['frames']} frames")
+    cap = pipeline.detach_capture()
+    if cap is not None:
+        cap.release()
+    if not headless:
+        cv2.destroyAllWindows()
+    close_piano()
+    if hands is not None:
+        hands.close()
     
     print("[OK] Application closed successfully.")
     print("Thanks for using Hand Detection - Finger Counter!\n")
 
 if __name__ == "__main__":
     main()
-
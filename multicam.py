@@ -0,0 +1,322 @@
+import argparse
+import json
+import math
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from cameras import open_camera
+from landmarks import results_to_arrays, finger_states_batch, landmarks_to_pixels
+from overlay import draw_skeletons
+
+SCHEDULE_ROUND_ROBIN = "round_robin"
+SCHEDULE_PRIORITY = "priority"
+
+
+class CameraStream:
+    def __init__(self, camera_id, camera_info, cap, priority=0):
+        self.camera_id = camera_id
+        self.camera_info = camera_info
+        self.cap = cap
+        self.priority = priority
+        self.frame = None
+        self.frame_id = 0
+        self.processed_id = 0
+        self.busy = False
+        self.captured = 0
+        self.processed = 0
+        self.result = None
+        self.failed = False
+
+
+class InferenceScheduler:
+    def __init__(self, streams, schedule=SCHEDULE_ROUND_ROBIN):
+        if schedule not in (SCHEDULE_ROUND_ROBIN, SCHEDULE_PRIORITY):
+            raise ValueError(f"Unknown schedule: {schedule}")
+        self.streams = streams
+        self.schedule = schedule
+        self._condition = threading.Condition()
+        self._next = 0
+        self.stopped = False
+
+    def publish_frame(self, stream, frame):
+        with self._condition:
+            stream.frame = frame
+            stream.frame_id += 1
+            stream.captured += 1
+            self._condition.notify()
+
+    def next_job(self, timeout=0.1):
+        with self._condition:
+            while not self.stopped:
+                stream = self._pick()
+                if stream is not None:
+                    stream.busy = True
+                    return stream, stream.frame_id, stream.frame
+                self._condition.wait(timeout)
+        return None
+
+    def finish_job(self, stream, frame_id, result):
+        with self._condition:
+            stream.busy = False
+            stream.processed_id = frame_id
+            stream.processed += 1
+            stream.result = result
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self.stopped = True
+            self._condition.notify_all()
+
+    def _pick(self):
+        ready = [stream for stream in self.streams
+                 if not stream.busy and stream.frame_id > stream.processed_id]
+        if not ready:
+            return None
+        if self.schedule == SCHEDULE_PRIORITY:
+            top = max(stream.priority for stream in ready)
+            ready = [stream for stream in ready if stream.priority == top]
+        # round robin among the candidates, starting after the last camera served
+        count = len(self.streams)
+        ready.sort(key=lambda stream: (stream.camera_id - self._next) % count)
+        self._next = (ready[0].camera_id + 1) % count
+        return ready[0]
+
+
+class MultiCameraRunner:
+    def __init__(self, streams, hands_factory, workers=2, schedule=SCHEDULE_ROUND_ROBIN, output_dir=None):
+        self.streams = streams
+        self.hands_factory = hands_factory
+        self.workers = max(1, workers)
+        self.scheduler = InferenceScheduler(streams, schedule)
+        self.output_dir = output_dir
+        self._stop = threading.Event()
+        self._threads = []
+        self._outputs = {}
+        self.start_time = None
+
+    def start(self):
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+            for stream in self.streams:
+                path = os.path.join(self.output_dir, f"camera_{stream.camera_info['index']}.jsonl")
+                self._outputs[stream.camera_id] = (open(path, 'w', encoding='utf-8'), threading.Lock())
+
+        self.start_time = time.time()
+        for stream in self.streams:
+            self._threads.append(threading.Thread(target=self._capture_loop, args=(stream,),
+                                                  name=f"capture-{stream.camera_id}", daemon=True))
+        for worker_id in range(self.workers):
+            self._threads.append(threading.Thread(target=self._inference_loop,
+                                                  name=f"inference-{worker_id}", daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self.scheduler.stop()
+        for thread in self._threads:
+            thread.join(1.0)
+        for stream in self.streams:
+            stream.cap.release()
+        for f, _ in self._outputs.values():
+            f.close()
+
+    def stats(self):
+        elapsed = max(time.time() - self.start_time, 1e-6)
+        cameras = {stream.camera_info["index"]: {
+            "capture_fps": stream.captured / elapsed,
+            "processed_fps": stream.processed / elapsed,
+            "processed": stream.processed
+        } for stream in self.streams}
+        return {
+            "elapsed": elapsed,
+            "aggregate_fps": sum(stream.processed for stream in self.streams) / elapsed,
+            "cameras": cameras
+        }
+
+    def _capture_loop(self, stream):
+        failures = 0
+        while not self._stop.is_set():
+            ret, frame = stream.cap.read()
+            if not ret or frame is None:
+                failures += 1
+                if failures >= 10:
+                    print(f"[ERROR] Camera {stream.camera_info['index']} stopped delivering frames")
+                    stream.failed = True
+                    return
+                time.sleep(0.1)
+                continue
+            failures = 0
+            self.scheduler.publish_frame(stream, frame)
+
+    def _inference_loop(self):
+        hands = self.hands_factory()
+        try:
+            while not self._stop.is_set():
+                job = self.scheduler.next_job()
+                if job is None:
+                    continue
+                stream, frame_id, frame = job
+                # detect on the camera frame, results_to_arrays mirrors the landmarks to the flipped tile
+                results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+                frame = cv2.flip(frame, 1)
+                landmarks, is_right = results_to_arrays(results)
+                result = {
+                    "camera_id": stream.camera_id,
+                    "camera_index": stream.camera_info["index"],
+                    "frame_id": frame_id,
+                    "timestamp": time.time(),
+                    "frame": frame,
+                    "results": results,
+                    "landmarks": landmarks,
+                    "is_right": is_right,
+                    "finger_states": finger_states_batch(landmarks, is_right)
+                }
+                self.scheduler.finish_job(stream, frame_id, result)
+                if stream.camera_id in self._outputs:
+                    self._write_result(result)
+        finally:
+            hands.close()
+
+    def _write_result(self, result):
+        hands = [{
+            "handedness": "right" if right else "left",
+            "fingers": int(states.sum()),
+            "landmarks": landmarks.tolist()
+        } for landmarks, right, states in zip(result["landmarks"], result["is_right"], result["finger_states"])]
+        line = json.dumps({"camera": result["camera_index"], "frame": result["frame_id"],
+                           "timestamp": result["timestamp"], "hands": hands})
+        f, lock = self._outputs[result["camera_id"]]
+        with lock:
+            f.write(line + "\n")
+
+
+def render_tiles(runner, tile_size):
+    tile_width, tile_height = tile_size
+    count = len(runner.streams)
+    columns = math.ceil(math.sqrt(count))
+    rows = math.ceil(count / columns)
+    canvas = np.zeros((rows * tile_height, columns * tile_width, 3), dtype=np.uint8)
+    stats = runner.stats()["cameras"]
+
+    for position, stream in enumerate(runner.streams):
+        result = stream.result
+        y0 = (position // columns) * tile_height
+        x0 = (position % columns) * tile_width
+        tile = canvas[y0:y0 + tile_height, x0:x0 + tile_width]
+        if result is not None:
+            tile[:] = cv2.resize(result["frame"], tile_size)
+            draw_skeletons(tile, landmarks_to_pixels(result["landmarks"], tile_width, tile_height))
+            fingers = int(result["finger_states"].sum())
+        else:
+            fingers = 0
+
+        camera_stats = stats[stream.camera_info["index"]]
+        cv2.rectangle(tile, (5, 5), (tile_width - 5, 60), (0, 0, 0), -1)
+        cv2.putText(tile, f"Camera {stream.camera_info['index']} - {fingers} fingers", (12, 28),
+                  cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+        cv2.putText(tile, f"capture {camera_stats['capture_fps']:.1f} / processed {camera_stats['processed_fps']:.1f} FPS",
+                  (12, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (255, 255, 255), 1)
+    return canvas
+
+def print_stats(stats):
+    print(f"[STATS] Aggregate: {stats['aggregate_fps']:.1f} FPS over {stats['elapsed']:.1f}s")
+    for camera_index, camera_stats in stats["cameras"].items():
+        print(f"[STATS]   Camera {camera_index}: capture {camera_stats['capture_fps']:.1f} FPS, "
+              f"processed {camera_stats['processed_fps']:.1f} FPS")
+
+def run_multi_camera(cameras, hands_factory, width, height, workers=2,
+                     schedule=SCHEDULE_ROUND_ROBIN, priorities=None, tile_size=(480, 360),
+                     headless=False, output_dir=None, duration=None, stats_interval=5.0):
+    priorities = priorities or {}
+    streams = []
+    for camera_info in cameras:
+        cap = open_camera(camera_info, width, height)
+        if cap is None:
+            print(f"[WARNING] Could not open camera {camera_info['index']}, skipping it")
+            continue
+        streams.append(CameraStream(len(streams), camera_info, cap, priorities.get(camera_info["index"], 0)))
+        print(f"[OK] Camera {camera_info['index']} opened ({camera_info['backend_name']})")
+
+    if not streams:
+        print("[ERROR] No cameras could be opened.")
+        return None
+
+    runner = MultiCameraRunner(streams, hands_factory, workers=workers, schedule=schedule, output_dir=output_dir)
+    runner.start()
+    print(f"[INFO] Processing {len(streams)} camera(s) with {runner.workers} inference worker(s) ({schedule})")
+    if output_dir:
+        print(f"[INFO] Writing detections to {output_dir}")
+
+    if not headless:
+        cv2.namedWindow('Hand Detection - Cameras', cv2.WINDOW_NORMAL)
+
+    last_stats = time.time()
+    try:
+        while True:
+            if duration is not None and time.time() - runner.start_time >= duration:
+                break
+            if all(stream.failed for stream in streams):
+                print("[ERROR] All cameras stopped delivering frames.")
+                break
+
+            if headless:
+                time.sleep(0.1)
+            else:
+                cv2.imshow('Hand Detection - Cameras', render_tiles(runner, tile_size))
+                key = cv2.waitKey(1) & 0xFF
+                if key == ord('q') or key == 27:
+                    print("\n[QUIT] Quitting application...")
+                    break
+
+            if time.time() - last_stats >= stats_interval:
+                print_stats(runner.stats())
+                last_stats = time.time()
+    except KeyboardInterrupt:
+        print("\n[QUIT] Interrupted")
+
+    stats = runner.stats()
+    runner.stop()
+    if not headless:
+        cv2.destroyAllWindows()
+    print_stats(stats)
+    return stats
+
+def main_cli():
+    import main
+
+    multi_config = main.config["multi_camera"]
+    parser = argparse.ArgumentParser(description="Process every camera at once with a shared pool of inference workers")
+    parser.add_argument("-w", "--workers", type=int, default=multi_config["workers"])
+    parser.add_argument("--schedule", choices=(SCHEDULE_ROUND_ROBIN, SCHEDULE_PRIORITY), default=multi_config["schedule"])
+    parser.add_argument("--priority", nargs="+", default=[], metavar="INDEX=PRIORITY",
+                        help="camera priorities for the priority schedule, e.g. 0=2 1=1")
+    parser.add_argument("--headless", action=argparse.BooleanOptionalAction, default=multi_config["headless"],
+                        help="don't open a window")
+    parser.add_argument("--output-dir", default=multi_config["output_dir"],
+                        help="write the detections of every camera to its own JSONL file")
+    parser.add_argument("--duration", type=float, help="stop after this many seconds")
+    args = parser.parse_args()
+
+    priorities = {int(k): int(v) for k, v in multi_config["priorities"].items()}
+    for item in args.priority:
+        camera_index, _, priority = item.partition("=")
+        priorities[int(camera_index)] = int(priority)
+
+    available_cameras = main.detect_all_cameras()
+    if not available_cameras:
+        print("\n[ERROR] No cameras found.")
+        return
+    run_multi_camera(available_cameras, main.create_multi_camera_hands,
+                     main.WINDOW_WIDTH, main.WINDOW_HEIGHT,
+                     workers=args.workers, schedule=args.schedule, priorities=priorities,
+                     tile_size=(multi_config["tile_width"], multi_config["tile_height"]),
+                     headless=args.headless, output_dir=args.output_dir, duration=args.duration)
+
+if __name__ == "__main__":
+    main_cli()
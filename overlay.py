@@ -0,0 +1,98 @@
+import functools
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from landmarks import HAND_CONNECTIONS
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+CONNECTION_COLOR = (0, 0, 255)
+JOINT_COLOR = (0, 255, 0)
+JOINT_BORDER_COLOR = (224, 224, 224)
+
+@functools.lru_cache(maxsize=512)
+def text_size(text, font_scale, thickness):
+    return cv2.getTextSize(text, FONT, font_scale, thickness)
+
+def draw_skeletons(frame, pixels):
+    # every hand in three polylines calls: bones, then joints as zero-length segments (drawn as round dots)
+    if not len(pixels):
+        return
+    bones = np.ascontiguousarray(pixels[:, HAND_CONNECTIONS].reshape(-1, 2, 2), dtype=np.int32)
+    cv2.polylines(frame, bones, False, CONNECTION_COLOR, 2)
+    joints = np.ascontiguousarray(np.repeat(pixels.reshape(-1, 1, 2), 2, axis=1), dtype=np.int32)
+    cv2.polylines(frame, joints, False, JOINT_BORDER_COLOR, 8)
+    cv2.polylines(frame, joints, False, JOINT_COLOR, 5)
+
+def render_layer(box, texts):
+    # box: (width, height, color) with its corner at the layer origin
+    # texts: ((text, (x, y), font_scale, color, thickness), ...) relative to the layer origin
+    left, top = 0, 0
+    right, bottom = (box[0] + 1, box[1] + 1) if box else (0, 0)
+    for text, (x, y), font_scale, color, thickness in texts:
+        (width, height), baseline = text_size(text, font_scale, thickness)
+        # some glyphs reach past the size getTextSize reports
+        pad = thickness + int(10 * font_scale) + 1
+        left = min(left, x - pad)
+        top = min(top, y - height - pad)
+        right = max(right, x + width + pad)
+        bottom = max(bottom, y + baseline + pad)
+
+    patch = np.zeros((bottom - top, right - left, 3), dtype=np.uint8)
+    mask = np.zeros((bottom - top, right - left), dtype=np.uint8)
+    if box:
+        cv2.rectangle(patch, (-left, -top), (box[0] - left, box[1] - top), box[2], -1)
+        cv2.rectangle(mask, (-left, -top), (box[0] - left, box[1] - top), 255, -1)
+    for text, (x, y), font_scale, color, thickness in texts:
+        cv2.putText(patch, text, (x - left, y - top), FONT, font_scale, color, thickness)
+        cv2.putText(mask, text, (x - left, y - top), FONT, font_scale, 255, thickness)
+
+    # layers that are a solid box are copied as a block, the rest through their mask
+    alpha = None if mask.all() else mask
+    return {"left": left, "top": top, "patch": patch, "alpha": alpha}
+
+
+class HudCache:
+    def __init__(self, max_layers=64):
+        self.max_layers = max_layers
+        self.hits = 0
+        self.misses = 0
+        self._layers = OrderedDict()
+        self._pending = []
+
+    def add(self, x, y, texts=(), box=None):
+        # the layer is rendered once per distinct content, then only moved and blended
+        key = (box, texts)
+        layer = self._layers.get(key)
+        if layer is None:
+            layer = self._layers[key] = render_layer(box, texts)
+            if len(self._layers) > self.max_layers:
+                self._layers.popitem(last=False)
+            self.misses += 1
+        else:
+            self._layers.move_to_end(key)
+            self.hits += 1
+        self._pending.append((x, y, layer))
+
+    def blend(self, frame):
+        height, width = frame.shape[:2]
+        for x, y, layer in self._pending:
+            x0 = x + layer["left"]
+            y0 = y + layer["top"]
+            patch = layer["patch"]
+            fx0, fy0 = max(x0, 0), max(y0, 0)
+            fx1, fy1 = min(x0 + patch.shape[1], width), min(y0 + patch.shape[0], height)
+            if fx0 >= fx1 or fy0 >= fy1:
+                continue
+            source = patch[fy0 - y0:fy1 - y0, fx0 - x0:fx1 - x0]
+            if layer["alpha"] is None:
+                frame[fy0:fy1, fx0:fx1] = source
+            else:
+                # cv2.copyTo writes through the frame view and is far faster than np.copyto(where=)
+                cv2.copyTo(source, layer["alpha"][fy0 - y0:fy1 - y0, fx0 - x0:fx1 - x0], frame[fy0:fy1, fx0:fx1])
+        self._pending.clear()
+
+    def discard(self):
+        self._pending.clear()
@@ -0,0 +1,162 @@
+import queue
+import threading
+import time
+
+from profiler import NULL_PROFILER
+
+POLICY_LATEST = "latest"
+POLICY_EVERY = "every"
+
+
+class StageQueue:
+    def __init__(self, name, maxsize=2, policy=POLICY_LATEST):
+        if policy not in (POLICY_LATEST, POLICY_EVERY):
+            raise ValueError(f"Unknown pipeline policy: {policy}")
+        self.name = name
+        self.policy = policy
+        self.maxsize = max(1, int(maxsize))
+        self._queue = queue.Queue(maxsize=self.maxsize)
+        self.put_count = 0
+        self.dropped = 0
+
+    def put(self, item, stop_event):
+        if self.policy == POLICY_LATEST:
+            while True:
+                try:
+                    self._queue.put_nowait(item)
+                    break
+                except queue.Full:
+                    try:
+                        self._queue.get_nowait()
+                        self.dropped += 1
+                    except queue.Empty:
+                        pass
+        else:
+            while not stop_event.is_set():
+                try:
+                    self._queue.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            else:
+                return False
+        self.put_count += 1
+        return True
+
+    def get(self, timeout=None):
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def stats(self):
+        return {
+            "depth": self._queue.qsize(),
+            "maxsize": self.maxsize,
+            "frames": self.put_count,
+            "dropped": self.dropped
+        }
+
+
+class FramePipeline:
+    def __init__(self, cap, infer_fn, policy=POLICY_LATEST, queue_size=2, max_failures=10,
+                 profiler=NULL_PROFILER):
+        self.infer_fn = infer_fn
+        self.profiler = profiler
+        self.policy = policy
+        self.max_failures = max_failures
+        self.capture_queue = StageQueue("capture", queue_size, policy)
+        self.result_queue = StageQueue("inference", queue_size, policy)
+        self.failed = False
+        self.error = None
+        self._cap = cap
+        self._cap_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+        self._frame_id = 0
+
+    def start(self):
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="capture", daemon=True),
+            threading.Thread(target=self._inference_loop, name="inference", daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout=1.0):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def detach_capture(self):
+        with self._cap_lock:
+            cap = self._cap
+            self._cap = None
+        return cap
+
+    def attach_capture(self, cap):
+        with self._cap_lock:
+            self._cap = cap
+
+    def get_result(self, timeout=None):
+        return self.result_queue.get(timeout)
+
+    def stats(self):
+        return {
+            "policy": self.policy,
+            "capture": self.capture_queue.stats(),
+            "inference": self.result_queue.stats()
+        }
+
+    def _capture_loop(self):
+        consecutive_failures = 0
+        while not self._stop.is_set():
+            with self._cap_lock:
+                cap = self._cap
+                if cap is None:
+                    ret, frame = False, None
+                else:
+                    start = self.profiler.now()
+                    ret, frame = cap.read()
+                    self.profiler.record("capture", start)
+            if cap is None:
+                time.sleep(0.01)
+                continue
+
+            if not ret or frame is None:
+                consecutive_failures += 1
+                if consecutive_failures >= self.max_failures:
+                    self.failed = True
+                    self._stop.set()
+                    break
+                time.sleep(0.1)
+                continue
+            consecutive_failures = 0
+
+            self._frame_id += 1
+            item = {"frame_id": self._frame_id, "timestamp": time.time(), "frame": frame}
+            self.capture_queue.put(item, self._stop)
+
+    def _inference_loop(self):
+        while not self._stop.is_set():
+            item = self.capture_queue.get(timeout=0.1)
+            if item is None:
+                continue
+            try:
+                item["frame"], item["results"], item["arrays"] = self.infer_fn(item["frame"])
+            except Exception as e:
+                self.error = e
+                self.failed = True
+                self._stop.set()
+                break
+            item["inference_done"] = time.time()
+            self.result_queue.put(item, self._stop)
+
+
+def format_stats(stats):
+    capture = stats["capture"]
+    inference = stats["inference"]
+    return (f"Q cap {capture['depth']}/{capture['maxsize']} drop {capture['dropped']} | "
+            f"inf {inference['depth']}/{inference['maxsize']} drop {inference['dropped']}")
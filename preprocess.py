@@ -0,0 +1,98 @@
+import threading
+
+import cv2
+import numpy as np
+
+
+class FramePreprocessor:
+    def __init__(self, width, height, max_free=8):
+        self.size = (width, height)
+        self.max_free = max_free
+        self._lock = threading.Lock()
+        # display frames go to the render thread and come back with release()
+        self._free = []
+        # resize and RGB buffers never leave the inference thread, one of each is reused every frame
+        self._scratch = {}
+        # camera frame and its unflipped window-size resize from the last display() call
+        self._resized = (None, None)
+        self.frames = 0
+        self.allocations = 0
+        self.resizes = 0
+
+    def _allocate(self, shape):
+        self.allocations += 1
+        return np.empty(shape, dtype=np.uint8)
+
+    def _scratch_buffer(self, name, shape):
+        buffer = self._scratch.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = self._allocate(shape)
+            self._scratch[name] = buffer
+        return buffer
+
+    def acquire(self):
+        shape = (self.size[1], self.size[0], 3)
+        with self._lock:
+            while self._free:
+                buffer = self._free.pop()
+                if buffer.shape == shape:
+                    return buffer
+        return self._allocate(shape)
+
+    def release(self, frame):
+        # only hand back frames that came from display() and are no longer drawn on or shown
+        with self._lock:
+            if len(self._free) < self.max_free:
+                self._free.append(frame)
+
+    def display(self, frame):
+        # mirrored window-size copy to draw on, one pass when the camera already delivers the window size
+        self.frames += 1
+        output = self.acquire()
+        if frame.shape[1::-1] == self.size:
+            cv2.flip(frame, 1, dst=output)
+            return output
+        self.resizes += 1
+        if frame.shape[1] < self.size[0]:
+            # upscaling: flip the smaller camera frame, then resize
+            flipped = self._scratch_buffer("flipped", frame.shape)
+            cv2.flip(frame, 1, dst=flipped)
+            cv2.resize(flipped, self.size, dst=output)
+            return output
+        resized = self._scratch_buffer("display", output.shape)
+        cv2.resize(frame, self.size, dst=resized)
+        self._resized = (frame, resized)
+        cv2.flip(resized, 1, dst=output)
+        return output
+
+    def rgb(self, frame, size=None):
+        # unmirrored RGB frame for inference, results_to_arrays mirrors the landmarks instead of the pixels
+        if size is None or size == frame.shape[1::-1]:
+            rgb_frame = self._scratch_buffer("rgb", frame.shape)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+            return rgb_frame
+
+        # the window size is resized like the display frame, smaller governor sizes are averaged
+        interpolation = cv2.INTER_LINEAR if size == self.size else cv2.INTER_AREA
+        rgb_frame = self._scratch_buffer("rgb", (size[1], size[0], 3))
+        resized_from, resized = self._resized
+        if resized_from is frame and resized.shape[1::-1] == size:
+            # display() already resized this frame to the same size
+            cv2.cvtColor(resized, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+        elif size[0] > frame.shape[1]:
+            # upscaling: swap the channels on the smaller camera frame, then resize
+            camera_rgb = self._scratch_buffer("camera_rgb", frame.shape)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=camera_rgb)
+            cv2.resize(camera_rgb, size, dst=rgb_frame, interpolation=interpolation)
+        else:
+            source = self._scratch_buffer("inference", rgb_frame.shape)
+            cv2.resize(frame, size, dst=source, interpolation=interpolation)
+            cv2.cvtColor(source, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+        return rgb_frame
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "allocations": self.allocations,
+            "resizes": self.resizes
+        }
@@ -0,0 +1,140 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+QUANTILES = (50, 95, 99)
+
+
+class NullProfiler:
+    enabled = False
+
+    def now(self):
+        return 0.0
+
+    def record(self, stage, start):
+        pass
+
+    def add(self, stage, seconds):
+        pass
+
+    def summary(self):
+        return {}
+
+
+class StageProfiler:
+    enabled = True
+
+    def __init__(self, window=300):
+        self.window = window
+        self._samples = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def now(self):
+        return time.perf_counter()
+
+    def record(self, stage, start):
+        self.add(stage, time.perf_counter() - start)
+
+    def add(self, stage, seconds):
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = np.zeros(self.window)
+                self._counts[stage] = 0
+            samples[self._counts[stage] % self.window] = seconds
+            self._counts[stage] += 1
+
+    def summary(self):
+        with self._lock:
+            snapshot = {stage: (samples[:min(self._counts[stage], self.window)].copy(), self._counts[stage])
+                        for stage, samples in self._samples.items()}
+
+        summary = {}
+        for stage, (samples, count) in snapshot.items():
+            p50, p95, p99 = np.percentile(samples, QUANTILES)
+            summary[stage] = {
+                "count": count,
+                "mean": float(samples.mean()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99)
+            }
+        return summary
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def format_summary(summary):
+    return [f"{stage:<10} p50 {s['p50'] * 1000:5.1f} p95 {s['p95'] * 1000:5.1f} p99 {s['p99'] * 1000:5.1f} ms"
+            for stage, s in summary.items()]
+
+
+def prometheus_text(summary):
+    lines = ["# TYPE hands_stage_seconds summary"]
+    for stage, s in summary.items():
+        for quantile in QUANTILES:
+            lines.append(f'hands_stage_seconds{{stage="{stage}",quantile="{quantile / 100}"}} {s[f"p{quantile}"]:.6f}')
+        lines.append(f'hands_stage_seconds_count{{stage="{stage}"}} {s["count"]}')
+    return "\n".join(lines) + "\n"
+
+
+class ProfilerExporter:
+    def __init__(self, profiler, export_path=None, interval=5.0, prometheus_port=None):
+        self.profiler = profiler
+        self.export_path = export_path
+        self.interval = interval
+        self.prometheus_port = prometheus_port
+        self._stop = threading.Event()
+        self._thread = None
+        self._server = None
+
+    def start(self):
+        if self.export_path:
+            self._thread = threading.Thread(target=self._export_loop, name="profiler-export", daemon=True)
+            self._thread.start()
+            print(f"[INFO] Writing profiler stats to {self.export_path} every {self.interval}s")
+
+        if self.prometheus_port:
+            profiler = self.profiler
+
+            class MetricsHandler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path != "/metrics":
+                        self.send_error(404)
+                        return
+                    body = prometheus_text(profiler.summary()).encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; version=0.0.4")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, format, *args):
+                    pass
+
+            self._server = ThreadingHTTPServer(("127.0.0.1", self.prometheus_port), MetricsHandler)
+            threading.Thread(target=self._server.serve_forever, name="profiler-metrics", daemon=True).start()
+            print(f"[INFO] Profiler metrics at http://127.0.0.1:{self._server.server_port}/metrics")
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self.interval + 1.0)
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def _export_loop(self):
+        with open(self.export_path, 'a', encoding='utf-8') as f:
+            while not self._stop.wait(self.interval):
+                self._write(f)
+            self._write(f)
+
+    def _write(self, f):
+        f.write(json.dumps({"timestamp": time.time(), "stages": self.profiler.summary()}) + "\n")
+        f.flush()
@@ -0,0 +1,139 @@
+import os
+import struct
+import time
+
+import numpy as np
+
+from landmarks import NUM_LANDMARKS, arrays_to_results
+
+MAGIC = b"HLRECORD"
+VERSION = 1
+MAX_HANDS = 2
+
+# magic, version, max hands, record size, chunk frames, created; padded so records start aligned
+HEADER = struct.Struct("<8sHHIId")
+HEADER_SIZE = 64
+
+def frame_dtype(max_hands=MAX_HANDS):
+    # one fixed-width record per frame, so frame i is at HEADER_SIZE + i * itemsize
+    return np.dtype([
+        ("timestamp", "<f8"),
+        ("hand_count", "u1"),
+        ("is_right", "u1", (max_hands,)),
+        ("landmarks", "<f4", (max_hands, NUM_LANDMARKS, 3))
+    ], align=True)
+
+
+class SessionRecorder:
+    def __init__(self, path, max_hands=MAX_HANDS, chunk_frames=256):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_hands = max_hands
+        self.dtype = frame_dtype(max_hands)
+        self.frames = 0
+        self.truncated = 0
+        self._chunk = np.zeros(max(1, chunk_frames), dtype=self.dtype)
+        self._count = 0
+        self._file = open(path, 'wb')
+        header = HEADER.pack(MAGIC, VERSION, max_hands, self.dtype.itemsize, len(self._chunk), time.time())
+        self._file.write(header.ljust(HEADER_SIZE, b"\0"))
+
+    def write(self, timestamp, landmarks, is_right):
+        hand_count = len(landmarks)
+        if hand_count > self.max_hands:
+            self.truncated += 1
+            hand_count = self.max_hands
+        record = self._chunk[self._count]
+        record["timestamp"] = timestamp
+        record["hand_count"] = hand_count
+        record["is_right"][:hand_count] = is_right[:hand_count]
+        record["is_right"][hand_count:] = 0
+        record["landmarks"][:hand_count] = landmarks[:hand_count]
+        record["landmarks"][hand_count:] = 0
+        self._count += 1
+        self.frames += 1
+        if self._count == len(self._chunk):
+            self.flush()
+
+    def flush(self):
+        # whole chunks go to disk at once; a crash loses at most one chunk
+        if self._count:
+            self._file.write(self._chunk[:self._count].tobytes())
+            self._file.flush()
+            self._count = 0
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+
+class SessionReader:
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path} is not a landmark recording")
+        magic, version, max_hands, record_size, chunk_frames, created = HEADER.unpack_from(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a landmark recording")
+        self.dtype = frame_dtype(max_hands)
+        if self.dtype.itemsize != record_size:
+            raise ValueError(f"{path} has {record_size}-byte records, expected {self.dtype.itemsize}")
+
+        self.path = path
+        self.max_hands = max_hands
+        self.created = created
+        # a partially written last record (e.g. after a crash) is ignored
+        count = (os.path.getsize(path) - HEADER_SIZE) // record_size
+        if count > 0:
+            self.frames = np.memmap(path, dtype=self.dtype, mode='r', offset=HEADER_SIZE, shape=(count,))
+        else:
+            self.frames = np.zeros(0, dtype=self.dtype)
+        self.timestamps = self.frames["timestamp"]
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def duration(self):
+        if len(self.frames) < 2:
+            return 0.0
+        return float(self.timestamps[-1] - self.timestamps[0])
+
+    def arrays(self, index):
+        record = self.frames[index]
+        hand_count = int(record["hand_count"])
+        return record["landmarks"][:hand_count], record["is_right"][:hand_count].astype(bool)
+
+    def results(self, index):
+        return arrays_to_results(*self.arrays(index))
+
+    def find_time(self, seconds):
+        # index of the first frame at or after this many seconds into the recording
+        if not len(self.frames):
+            return 0
+        index = np.searchsorted(self.timestamps, self.timestamps[0] + seconds)
+        return int(min(index, len(self.frames) - 1))
+
+    def play(self, start=0, end=None, speed=1.0):
+        # yields frame indices, paced like the recording unless speed is None
+        end = len(self.frames) if end is None else min(end, len(self.frames))
+        if start >= end:
+            return
+        wall_start = time.perf_counter()
+        first = self.timestamps[start]
+        for index in range(start, end):
+            if speed:
+                delay = (self.timestamps[index] - first) / speed - (time.perf_counter() - wall_start)
+                if delay > 0:
+                    time.sleep(delay)
+            yield index
+
+    def close(self):
+        # the mapping is released once no array views of it are left
+        self.frames = np.zeros(0, dtype=self.dtype)
+        self.timestamps = self.frames["timestamp"]
@@ -0,0 +1,89 @@
+import argparse
+import os
+import time
+
+import cv2
+import numpy as np
+
+import main
+from recording import SessionReader
+
+def replay(reader, start=0, end=None, speed=1.0, headless=False):
+    canvas = np.zeros((main.WINDOW_HEIGHT, main.WINDOW_WIDTH, 3), dtype=np.uint8)
+    replayed = 0
+    last_index = start
+    wall_start = time.perf_counter()
+    for index in reader.play(start, end, speed):
+        if not headless:
+            canvas[:] = 0
+        # headless runs keep the game logic but skip all drawing
+        frame = main.render_frame(canvas, None, 0, 1, draw=not headless,
+                                  timestamp=float(reader.timestamps[index]), arrays=reader.arrays(index))
+        replayed += 1
+        last_index = index
+        if not headless:
+            cv2.putText(frame, f"Replay {index + 1}/{len(reader)}", (10, main.WINDOW_HEIGHT - 90),
+                      cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+            cv2.imshow('Hand Detection - Replay', frame)
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord('q') or key == 27:
+                print("\n[QUIT] Replay stopped")
+                break
+    elapsed = time.perf_counter() - wall_start
+    recorded = float(reader.timestamps[last_index] - reader.timestamps[start]) if replayed else 0.0
+    return {"frames": replayed, "elapsed": elapsed, "recorded": recorded}
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Replay a recorded landmark session through the games and overlay without camera or model")
+    parser.add_argument("recording", help="file written with recording enabled in config.json")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed, 1 is the original timing")
+    parser.add_argument("--max-speed", action="store_true", help="replay as fast as possible")
+    parser.add_argument("--start", type=int, help="first frame to replay")
+    parser.add_argument("--start-time", type=float, help="seconds into the recording to start at")
+    parser.add_argument("--frames", type=int, help="number of frames to replay")
+    parser.add_argument("--game", choices=("piano_game", "coins_game"), help="replay with this game enabled")
+    parser.add_argument("--headless", action="store_true", help="don't open a window")
+    args = parser.parse_args()
+
+    reader = SessionReader(args.recording)
+    if not len(reader):
+        print(f"[ERROR] {args.recording} has no frames")
+        return
+    print(f"[OK] {len(reader)} frames ({reader.duration:.1f}s) loaded from {args.recording}")
+
+    start = args.start or 0
+    if args.start_time is not None:
+        start = reader.find_time(args.start_time)
+    end = start + args.frames if args.frames else None
+
+    if args.headless:
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    if args.game:
+        for game in main.config["GAMES"]:
+            main.config["GAMES"][game] = game == args.game
+    if main.init_piano():
+        print("[OK] Piano mode initialized")
+    if main.config["GAMES"]["coins_game"]:
+        main.coins_game = main.init_coins_game()
+    if not args.headless:
+        cv2.namedWindow('Hand Detection - Replay', cv2.WINDOW_NORMAL)
+        cv2.resizeWindow('Hand Detection - Replay', main.WINDOW_WIDTH, main.WINDOW_HEIGHT)
+
+    try:
+        stats = replay(reader, start, end, None if args.max_speed else args.speed, args.headless)
+    except KeyboardInterrupt:
+        print("\n[QUIT] Interrupted")
+        return
+    finally:
+        if not args.headless:
+            cv2.destroyAllWindows()
+        main.close_piano()
+        reader.close()
+
+    print(f"[STATS] Replayed {stats['frames']} frames in {stats['elapsed']:.2f}s "
+          f"({stats['frames'] / max(stats['elapsed'], 1e-9):.0f} frames/sec)")
+    if stats["recorded"] > 0:
+        print(f"[STATS] {stats['recorded']:.1f}s of recording, {stats['recorded'] / max(stats['elapsed'], 1e-9):.1f}x real time")
+
+if __name__ == "__main__":
+    main_cli()
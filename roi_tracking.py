@@ -0,0 +1,108 @@
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from landmarks import landmarks_to_array
+
+class RoiTracker:
+    def __init__(self, full_hands, crop_hands, keyframe_interval=10, padding=0.25,
+                 min_confidence=0.7, min_crop_size=64):
+        self.full_hands = full_hands
+        self.crop_hands = crop_hands
+        self.keyframe_interval = max(1, int(keyframe_interval))
+        self.padding = padding
+        self.min_confidence = min_confidence
+        self.min_crop_size = min_crop_size
+        self._previous = None
+        self._frames_since_keyframe = 0
+        self.frames = 0
+        self.keyframes = 0
+        self.fallbacks = 0
+        self.roi_frames = 0
+        self.roi_latency = 0.0
+        self.keyframe_latency = 0.0
+
+    def process(self, rgb_frame):
+        start = time.perf_counter()
+        results = None
+
+        if self._previous is not None and self._frames_since_keyframe < self.keyframe_interval - 1:
+            results = self._process_crops(rgb_frame)
+            if results is None:
+                self.fallbacks += 1
+            else:
+                self.roi_frames += 1
+                self._frames_since_keyframe += 1
+                self.roi_latency += time.perf_counter() - start
+
+        if results is None:
+            results = self.full_hands.process(rgb_frame)
+            self.keyframes += 1
+            self._frames_since_keyframe = 0
+            self.keyframe_latency += time.perf_counter() - start
+
+        self._previous = results if results.multi_hand_landmarks else None
+        self.frames += 1
+        return results
+
+    def hand_boxes(self, results, width, height):
+        boxes = []
+        for hand in results.multi_hand_landmarks:
+            points = landmarks_to_array(hand.landmark)[:, :2] * (width, height)
+            x_min, y_min = points.min(axis=0)
+            x_max, y_max = points.max(axis=0)
+            pad = self.padding * max(x_max - x_min, y_max - y_min, self.min_crop_size)
+            x0 = int(max(0, x_min - pad))
+            y0 = int(max(0, y_min - pad))
+            x1 = int(min(width, x_max + pad))
+            y1 = int(min(height, y_max + pad))
+            if x1 - x0 < self.min_crop_size or y1 - y0 < self.min_crop_size:
+                return None
+            boxes.append((x0, y0, x1, y1))
+        return boxes
+
+    def _process_crops(self, rgb_frame):
+        height, width = rgb_frame.shape[:2]
+        boxes = self.hand_boxes(self._previous, width, height)
+        if boxes is None:
+            return None
+
+        hand_landmarks = []
+        handedness = []
+        wrists = []
+        for x0, y0, x1, y1 in boxes:
+            crop = np.ascontiguousarray(rgb_frame[y0:y1, x0:x1])
+            crop_results = self.crop_hands.process(crop)
+            if not crop_results.multi_hand_landmarks:
+                return None
+            classification = crop_results.multi_handedness[0].classification[0]
+            if classification.score < self.min_confidence:
+                return None
+
+            landmarks = crop_results.multi_hand_landmarks[0]
+            for landmark in landmarks.landmark:
+                landmark.x = (x0 + landmark.x * (x1 - x0)) / width
+                landmark.y = (y0 + landmark.y * (y1 - y0)) / height
+
+            wrist = (landmarks.landmark[0].x, landmarks.landmark[0].y)
+            if any(abs(wrist[0] - x) < 0.02 and abs(wrist[1] - y) < 0.02 for x, y in wrists):
+                # two crops locked onto the same hand
+                return None
+            wrists.append(wrist)
+            hand_landmarks.append(landmarks)
+            handedness.append(crop_results.multi_handedness[0])
+
+        return SimpleNamespace(multi_hand_landmarks=hand_landmarks, multi_handedness=handedness)
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "keyframes": self.keyframes,
+            "roi_frames": self.roi_frames,
+            "fallbacks": self.fallbacks,
+            "full_frame_inferences_saved": self.roi_frames,
+            "avg_latency_ms": 1000 * (self.roi_latency + self.keyframe_latency) / self.frames if self.frames else 0.0,
+            "roi_latency_ms": 1000 * self.roi_latency / self.roi_frames if self.roi_frames else 0.0,
+            "keyframe_latency_ms": 1000 * self.keyframe_latency / self.keyframes if self.keyframes else 0.0
+        }
@@ -0,0 +1,89 @@
+import argparse
+import json
+import socket
+import time
+
+from stream_server import LENGTH, decode_binary
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+def connect(host="127.0.0.1", port=8765, unix_socket=None):
+    if unix_socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(unix_socket)
+    else:
+        sock = socket.create_connection((host, port))
+    return sock
+
+def read_exactly(sock, size):
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            raise ConnectionError("Stream closed by the server")
+        received += count
+    return buffer
+
+def read_messages(sock):
+    while True:
+        length, = LENGTH.unpack(read_exactly(sock, LENGTH.size))
+        yield read_exactly(sock, length)
+
+def decode_message(payload, encoding="binary"):
+    if encoding == "binary":
+        return decode_binary(payload)
+    if encoding == "msgpack":
+        return msgpack.unpackb(bytes(payload))
+    return json.loads(bytes(payload))
+
+def read_frames(host="127.0.0.1", port=8765, unix_socket=None, encoding="binary"):
+    sock = connect(host, port, unix_socket)
+    try:
+        for payload in read_messages(sock):
+            yield decode_message(payload, encoding)
+    finally:
+        sock.close()
+
+def describe_frame(frame):
+    if "hands" in frame:
+        hands = [(hand["handedness"], sum(hand["finger_states"])) for hand in frame["hands"]]
+    else:
+        hands = [("right" if right else "left", int(states.sum()))
+                 for right, states in zip(frame["is_right"], frame["finger_states"])]
+    latency = (time.time() - frame["timestamp"]) * 1000
+    described = ", ".join(f"{handedness} {fingers} fingers" for handedness, fingers in hands) or "no hands"
+    return f"frame {frame['frame']}: {described} ({latency:.1f} ms old)"
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Subscribe to the landmark stream of a running app")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix-socket", help="connect to this Unix socket instead of TCP")
+    parser.add_argument("--encoding", choices=("binary", "msgpack", "json"), default="binary",
+                        help="encoding the server was configured with")
+    parser.add_argument("--quiet", action="store_true", help="only print the rate once per second")
+    args = parser.parse_args()
+
+    received = 0
+    last_report = time.time()
+    try:
+        for frame in read_frames(args.host, args.port, args.unix_socket, args.encoding):
+            received += 1
+            if not args.quiet:
+                print(describe_frame(frame))
+            if time.time() - last_report >= 1.0:
+                print(f"[STATS] {received / (time.time() - last_report):.1f} frames/sec")
+                received = 0
+                last_report = time.time()
+    except ConnectionError as e:
+        print(f"[INFO] {e}")
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,318 @@
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import socket
+import struct
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from landmarks import NUM_LANDMARKS
+
+MAGIC = b"HLMK"
+VERSION = 1
+ENCODINGS = ("binary", "msgpack", "json")
+
+# magic, version, flags, hand count, frame id, timestamp
+HEADER = struct.Struct("<4sBBHQd")
+LENGTH = struct.Struct("<I")
+# about one frame of JSON with two hands; anything more waiting in the transport is already stale
+WRITE_BUFFER_LIMIT = 4096
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+WS_TEXT = 0x1
+WS_BINARY = 0x2
+WS_CLOSE = 0x8
+WS_PING = 0x9
+WS_PONG = 0xA
+
+def encode_binary(frame_id, timestamp, landmarks, is_right, finger_states):
+    # layout: header | float32 landmarks (hands, 21, 3) | uint8 is_right (hands) | uint8 finger bitmask (hands)
+    header = HEADER.pack(MAGIC, VERSION, 0, len(landmarks), frame_id, timestamp)
+    landmarks = np.ascontiguousarray(landmarks, dtype=np.float32).reshape(-1).view(np.uint8)
+    masks = np.packbits(finger_states, axis=1, bitorder="little")
+    return [header, memoryview(landmarks), is_right.astype(np.uint8).tobytes(), masks.tobytes()]
+
+def decode_binary(payload):
+    payload = memoryview(payload)
+    magic, version, flags, hand_count, frame_id, timestamp = HEADER.unpack_from(payload)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a landmark frame")
+    offset = HEADER.size
+    landmarks = np.frombuffer(payload, dtype=np.float32, count=hand_count * NUM_LANDMARKS * 3,
+                              offset=offset).reshape(hand_count, NUM_LANDMARKS, 3)
+    offset += landmarks.nbytes
+    is_right = np.frombuffer(payload, dtype=np.uint8, count=hand_count, offset=offset).astype(bool)
+    offset += hand_count
+    masks = np.frombuffer(payload, dtype=np.uint8, count=hand_count, offset=offset)
+    finger_states = np.unpackbits(masks[:, np.newaxis], axis=1, count=5, bitorder="little").astype(bool)
+    return {"frame": frame_id, "timestamp": timestamp, "landmarks": landmarks,
+            "is_right": is_right, "finger_states": finger_states}
+
+def frame_to_dict(frame_id, timestamp, landmarks, is_right, finger_states):
+    return {
+        "frame": frame_id,
+        "timestamp": timestamp,
+        "hands": [{
+            "handedness": "right" if right else "left",
+            "finger_states": states.tolist(),
+            "landmarks": hand.tolist()
+        } for hand, right, states in zip(landmarks, is_right, finger_states)]
+    }
+
+def encode_frame(encoding, frame):
+    if encoding == "binary":
+        return encode_binary(*frame)
+    if encoding == "msgpack":
+        return [msgpack.packb(frame_to_dict(*frame))]
+    return [json.dumps(frame_to_dict(*frame)).encode("utf-8")]
+
+def ws_frame_header(length, opcode):
+    if length < 126:
+        return struct.pack("!BB", 0x80 | opcode, length)
+    if length < 2**16:
+        return struct.pack("!BBH", 0x80 | opcode, 126, length)
+    return struct.pack("!BBQ", 0x80 | opcode, 127, length)
+
+
+class StreamClient:
+    def __init__(self, writer, encoding, websocket, queue_size):
+        self.writer = writer
+        self.encoding = encoding
+        self.websocket = websocket
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.peer = writer.get_extra_info("peername") or "unix"
+        # keep the backlog in our drop-oldest queue, not in the transport and kernel buffers
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER_LIMIT)
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, WRITE_BUFFER_LIMIT)
+        self.handler = None
+        self.sent = 0
+        self.dropped = 0
+
+
+class LandmarkStreamServer:
+    def __init__(self, host="127.0.0.1", port=8765, unix_socket=None, websocket_port=None,
+                 encoding="binary", queue_size=4):
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown stream encoding: {encoding}")
+        if encoding == "msgpack" and msgpack is None:
+            print("[WARNING] msgpack is not installed, streaming JSON instead")
+            encoding = "json"
+        self.host = host
+        self.port = port
+        self.unix_socket = unix_socket
+        self.websocket_port = websocket_port
+        self.encoding = encoding
+        self.queue_size = queue_size
+        self.frame_id = 0
+        self.published = 0
+        self.coalesced = 0
+        self._clients = set()
+        self._pending = None
+        self._pending_lock = threading.Lock()
+        self._scheduled = False
+        self._loop = None
+        self._servers = []
+        self._thread = None
+        self._ready = threading.Event()
+        self.addresses = {}
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="stream-server", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        for name, address in self.addresses.items():
+            print(f"[INFO] Streaming landmarks ({self.encoding}) on {name} {address}")
+
+    def stop(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=2.0)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(2.0)
+        self._loop = None
+
+    def publish(self, landmarks, is_right, finger_states, timestamp=None):
+        # called from the detection loop: never blocks, encoding happens on the server thread
+        if not self._clients:
+            return
+        self.frame_id += 1
+        self.published += 1
+        frame = (self.frame_id, timestamp if timestamp is not None else time.time(),
+                 landmarks, is_right, finger_states)
+        # keep one pending frame: if the server thread falls behind, newer frames replace older ones
+        with self._pending_lock:
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = frame
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._loop.call_soon_threadsafe(self._broadcast)
+
+    def stats(self):
+        # the server thread adds and removes clients, so the client list is read on that thread
+        if self._loop is not None:
+            clients = asyncio.run_coroutine_threadsafe(self._client_stats(), self._loop).result(timeout=2.0)
+        else:
+            clients = self._client_stats_now()
+        return {
+            "published": self.published,
+            "coalesced": self.coalesced,
+            "clients": clients
+        }
+
+    async def _client_stats(self):
+        return self._client_stats_now()
+
+    def _client_stats_now(self):
+        return [{"peer": str(client.peer), "encoding": client.encoding,
+                 "sent": client.sent, "dropped": client.dropped,
+                 "queued": client.queue.qsize()} for client in self._clients]
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._open_servers())
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _open_servers(self):
+        if self.port is not None:
+            server = await asyncio.start_server(self._handle_tcp, self.host, self.port)
+            self._servers.append(server)
+            self.addresses["tcp"] = server.sockets[0].getsockname()[:2]
+        if self.unix_socket and hasattr(asyncio, "start_unix_server"):
+            if os.path.exists(self.unix_socket):
+                os.remove(self.unix_socket)
+            server = await asyncio.start_unix_server(self._handle_tcp, self.unix_socket)
+            self._servers.append(server)
+            self.addresses["unix"] = self.unix_socket
+        if self.websocket_port is not None:
+            server = await asyncio.start_server(self._handle_websocket, self.host, self.websocket_port)
+            self._servers.append(server)
+            self.addresses["websocket"] = server.sockets[0].getsockname()[:2]
+
+    async def _shutdown(self):
+        # Server.wait_closed() would wait for every subscriber to hang up, so just close everything
+        for server in self._servers:
+            server.close()
+        for client in list(self._clients):
+            client.writer.close()
+        if "unix" in self.addresses and os.path.exists(self.unix_socket):
+            os.remove(self.unix_socket)
+        # closing the transports ends every handler through EOF on its reader
+        handlers = [client.handler for client in self._clients]
+        if handlers:
+            await asyncio.wait(handlers, timeout=1.0)
+
+    def _broadcast(self):
+        with self._pending_lock:
+            frame = self._pending
+            self._pending = None
+            self._scheduled = False
+        encoded = {}
+        for client in self._clients:
+            payload = encoded.get(client.encoding)
+            if payload is None:
+                parts = encode_frame(client.encoding, frame)
+                payload = encoded[client.encoding] = (parts, sum(len(part) for part in parts))
+            if client.queue.full():
+                client.queue.get_nowait()
+                client.dropped += 1
+            client.queue.put_nowait(payload)
+
+    async def _serve(self, client, reader):
+        client.handler = asyncio.current_task()
+        self._clients.add(client)
+        sender = asyncio.ensure_future(self._send_loop(client))
+        try:
+            if client.websocket:
+                await self._read_websocket(client, reader)
+            else:
+                while await reader.read(1024):
+                    pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._clients.discard(client)
+            sender.cancel()
+            client.writer.close()
+
+    async def _send_loop(self, client):
+        opcode = WS_BINARY if client.encoding != "json" else WS_TEXT
+        try:
+            while True:
+                # wait for a slow reader here, meanwhile _broadcast drops the oldest queued frames
+                if client.writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+                    await client.writer.drain()
+                parts, length = await client.queue.get()
+                if client.websocket:
+                    header = ws_frame_header(length, opcode)
+                else:
+                    header = LENGTH.pack(length)
+                client.writer.writelines([header] + parts)
+                await client.writer.drain()
+                client.sent += 1
+        except ConnectionError:
+            pass
+
+    async def _handle_tcp(self, reader, writer):
+        await self._serve(StreamClient(writer, self.encoding, False, self.queue_size), reader)
+
+    async def _handle_websocket(self, reader, writer):
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            writer.close()
+            return
+        lines = request.decode("latin-1").split("\r\n")
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        key = headers.get("sec-websocket-key")
+        if key is None:
+            writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+            writer.close()
+            return
+
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode("ascii")).digest()).decode("ascii")
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode("ascii"))
+
+        path = lines[0].split(" ")[1] if len(lines[0].split(" ")) > 1 else "/"
+        encoding = parse_qs(urlsplit(path).query).get("format", [self.encoding])[0]
+        if encoding not in ENCODINGS or (encoding == "msgpack" and msgpack is None):
+            encoding = self.encoding
+        await self._serve(StreamClient(writer, encoding, True, self.queue_size), reader)
+
+    async def _read_websocket(self, client, reader):
+        while True:
+            first, second = await reader.readexactly(2)
+            opcode = first & 0x0F
+            length = second & 0x7F
+            if length == 126:
+                length = struct.unpack("!H", await reader.readexactly(2))[0]
+            elif length == 127:
+                length = struct.unpack("!Q", await reader.readexactly(8))[0]
+            mask = await reader.readexactly(4) if second & 0x80 else None
+            data = await reader.readexactly(length)
+            if mask:
+                data = bytes(b ^ mask[i % 4] for i, b in enumerate(data))
+            if opcode == WS_CLOSE:
+                client.writer.write(ws_frame_header(0, WS_CLOSE))
+                return
+            if opcode == WS_PING:
+                client.writer.write(ws_frame_header(len(data), WS_PONG) + data)
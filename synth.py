@@ -0,0 +1,143 @@
+import threading
+import time
+
+import numpy as np
+
+MAX_SAMPLE = 2**(16 - 1) - 1
+
+pygame = None
+
+def load_pygame():
+    # pygame is only needed for the piano, so it isn't imported until the piano starts
+    global pygame
+    if pygame is None:
+        import pygame as pygame_module
+        pygame = pygame_module
+    return pygame
+
+def generate_tone(frequency, duration=0.2, sample_rate=22050, amplitude=4096):
+    frames = int(duration * sample_rate)
+    i = np.arange(frames, dtype=np.float64)
+    t = i / sample_rate
+    wave = amplitude * np.sin(2 * np.pi * frequency * t)
+    
+    envelope = np.ones(frames)
+    attack = i < frames * 0.1
+    envelope[attack] = i[attack] / (frames * 0.1)
+    release = i > frames * 0.7
+    envelope[release] = 1.0 - ((i[release] - frames * 0.7) / (frames * 0.3))
+    wave *= envelope
+    
+    samples = np.clip(wave, -MAX_SAMPLE, MAX_SAMPLE).astype(np.int16)
+    return np.column_stack((samples, samples))
+
+
+class AudioEngine:
+    def __init__(self, notes, duration=0.2, sample_rate=22050, buffer_size=512, voices=8, queue_size=32):
+        self.frequencies = sorted({frequency for hand_notes in notes.values() for frequency in hand_notes.values()})
+        self._note_ids = {frequency: i for i, frequency in enumerate(self.frequencies)}
+        self.duration = duration
+        self.sample_rate = sample_rate
+        self.buffer_size = buffer_size
+        self.voice_count = voices
+        self.sounds = []
+        self.voices = []
+        
+        # single-producer/single-consumer ring: trigger() only moves _head, the worker only moves _tail
+        self.queue_size = queue_size
+        self._queued_notes = [0] * queue_size
+        self._queued_times = [0.0] * queue_size
+        self._head = 0
+        self._tail = 0
+        self._wake = threading.Event()
+        self._running = False
+        self._thread = None
+        
+        self._voice_started = np.zeros(voices, dtype=np.float64)
+        self._latencies = np.zeros(1024, dtype=np.float64)
+        self.triggered = 0
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+        self.errors = 0
+    
+    def start(self):
+        load_pygame()
+        pygame.mixer.init(frequency=self.sample_rate, size=-16, channels=2, buffer=self.buffer_size)
+        self.sounds = [pygame.sndarray.make_sound(generate_tone(frequency, self.duration, self.sample_rate))
+                       for frequency in self.frequencies]
+        pygame.mixer.set_num_channels(self.voice_count)
+        self.voices = [pygame.mixer.Channel(i) for i in range(self.voice_count)]
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, name="audio", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._running = False
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        pygame.mixer.quit()
+    
+    def trigger(self, frequency):
+        # called from the detection loop: a dict lookup and two list writes, it never waits
+        note = self._note_ids.get(frequency)
+        if note is None:
+            return False
+        self.triggered += 1
+        if self._head - self._tail >= self.queue_size:
+            self.dropped += 1
+            return False
+        slot = self._head % self.queue_size
+        self._queued_notes[slot] = note
+        self._queued_times[slot] = time.perf_counter()
+        self._head += 1
+        if not self._wake.is_set():
+            self._wake.set()
+        return True
+    
+    def _worker(self):
+        while self._running:
+            self._wake.wait(0.1)
+            self._wake.clear()
+            while self._tail < self._head:
+                slot = self._tail % self.queue_size
+                try:
+                    self._play(self._queued_notes[slot])
+                    self._latencies[self.played % len(self._latencies)] = time.perf_counter() - self._queued_times[slot]
+                    self.played += 1
+                except Exception as e:
+                    # this is the only audio thread, a bad note must not stop every later one
+                    if not self.errors:
+                        print(f"[WARNING] Could not play note: {e}")
+                    self.errors += 1
+                self._tail += 1
+    
+    def _play(self, note):
+        now = time.perf_counter()
+        voice = None
+        for i, candidate in enumerate(self.voices):
+            if not candidate.get_busy():
+                voice = i
+                break
+        if voice is None:
+            # every voice is sounding: cut the one that started first
+            voice = int(np.argmin(self._voice_started))
+            self.stolen += 1
+        self.voices[voice].play(self.sounds[note])
+        self._voice_started[voice] = now
+    
+    def stats(self):
+        latencies = self._latencies[:min(self.played, len(self._latencies))]
+        return {
+            "triggered": self.triggered,
+            "played": self.played,
+            "dropped": self.dropped,
+            "stolen": self.stolen,
+            "errors": self.errors,
+            "queue_latency_p50_ms": float(np.percentile(latencies, 50)) * 1000 if len(latencies) else 0.0,
+            "queue_latency_p99_ms": float(np.percentile(latencies, 99)) * 1000 if len(latencies) else 0.0,
+            # the mixer adds one buffer of delay before a note is heard
+            "buffer_latency_ms": self.buffer_size / self.sample_rate * 1000
+        }
@@ -0,0 +1,155 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import backends
+from backends import DEFAULT_OPTIONS, TasksBackend, open_backend, tasks_to_results
+
+
+def make_landmarks(offset):
+    return [SimpleNamespace(x=offset + i / 100, y=0.5, z=0.0) for i in range(21)]
+
+def make_handedness(label, score):
+    return [SimpleNamespace(category_name=label, score=score)]
+
+
+class FakeMediapipe:
+    ImageFormat = SimpleNamespace(SRGB="srgb")
+
+    @staticmethod
+    def Image(image_format, data):
+        return SimpleNamespace(image_format=image_format, data=data)
+
+
+class FakeLandmarker:
+    def __init__(self):
+        self.timestamps = []
+
+    def detect_for_video(self, image, timestamp_ms):
+        self.timestamps.append(timestamp_ms)
+        return SimpleNamespace(hand_landmarks=[], handedness=[])
+
+    def detect_async(self, image, timestamp_ms):
+        self.timestamps.append(timestamp_ms)
+
+
+def fake_tasks_backend(running_mode):
+    # skips __init__, which needs the .task model file
+    backend = TasksBackend.__new__(TasksBackend)
+    backend._mp = FakeMediapipe
+    backend.running_mode = running_mode
+    backend.landmarker = FakeLandmarker()
+    backend._last_timestamp = -1
+    backend._lock = backends.threading.Lock()
+    backend._latest = backends.empty_results()
+    backend.submitted = 0
+    backend.completed = 0
+    return backend
+
+
+def test_tasks_to_results_empty():
+    assert tasks_to_results(None).multi_hand_landmarks is None
+    results = tasks_to_results(SimpleNamespace(hand_landmarks=[], handedness=[]))
+    assert results.multi_hand_landmarks is None
+    assert results.multi_handedness is None
+
+def test_tasks_to_results_shape_and_handedness():
+    result = SimpleNamespace(hand_landmarks=[make_landmarks(0.1), make_landmarks(0.6)],
+                             handedness=[make_handedness("Left", 0.9), make_handedness("Right", 0.8)])
+    results = tasks_to_results(result)
+
+    assert len(results.multi_hand_landmarks) == 2
+    assert len(results.multi_hand_landmarks[0].landmark) == 21
+    assert results.multi_hand_landmarks[1].landmark[0].x == pytest.approx(0.6)
+    assert [h.classification[0].label for h in results.multi_handedness] == ["Left", "Right"]
+    assert results.multi_handedness[1].classification[0].score == pytest.approx(0.8)
+
+def test_tasks_to_results_feeds_results_to_arrays():
+    from landmarks import results_to_arrays
+
+    result = SimpleNamespace(hand_landmarks=[make_landmarks(0.1)], handedness=[make_handedness("Right", 0.9)])
+    landmarks, is_right = results_to_arrays(tasks_to_results(result))
+    assert landmarks.shape == (1, 21, 3)
+    # detection runs on the unflipped frame, so x is mirrored for the display
+    assert landmarks[0, 0, 0] == pytest.approx(0.9)
+    assert is_right.tolist() == [True]
+
+@pytest.mark.parametrize("running_mode", ["video", "live_stream"])
+def test_tasks_timestamps_increase(monkeypatch, running_mode):
+    backend = fake_tasks_backend(running_mode)
+    # a clock that stands still or goes back must not produce repeated timestamps
+    clock = iter([5.0, 5.0, 5.0, 4.0, 6.0])
+    monkeypatch.setattr(backends.time, "perf_counter", lambda: next(clock))
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+    for _ in range(5):
+        backend.process(frame)
+
+    timestamps = backend.landmarker.timestamps
+    assert timestamps == [5000, 5001, 5002, 5003, 6000]
+    if running_mode == "live_stream":
+        assert backend.submitted == 5
+
+def test_live_stream_returns_latest_callback_result():
+    backend = fake_tasks_backend("live_stream")
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+    assert backend.process(frame).multi_hand_landmarks is None
+
+    result = SimpleNamespace(hand_landmarks=[make_landmarks(0.2)], handedness=[make_handedness("Left", 0.9)])
+    backend._on_result(result, None, 0)
+    assert backend.completed == 1
+    assert len(backend.process(frame).multi_hand_landmarks) == 1
+
+
+class FakeBackend:
+    def __init__(self, name, delegate):
+        self.name = name
+        self.delegate = delegate
+
+
+def fake_create_backend(available, attempts):
+    def create_backend(name, options, static_image_mode=False, max_num_hands=None):
+        attempts.append((name, options["delegate"]))
+        if (name, options["delegate"]) not in available:
+            raise RuntimeError(f"{name} {options['delegate']} unavailable")
+        return FakeBackend(name, options["delegate"])
+    return create_backend
+
+@pytest.mark.parametrize("available, expected", [
+    ({("tasks_video", "gpu")}, ("tasks_video", "gpu")),
+    ({("tasks_video", "xnnpack")}, ("tasks_video", "xnnpack")),
+    ({("solutions", "xnnpack")}, ("solutions", "xnnpack")),
+])
+def test_open_backend_falls_back_gpu_xnnpack_solutions(monkeypatch, available, expected):
+    attempts = []
+    monkeypatch.setattr(backends, "create_backend", fake_create_backend(available, attempts))
+    backend = open_backend("tasks_video", dict(DEFAULT_OPTIONS, delegate="gpu"))
+
+    assert (backend.name, backend.delegate) == expected
+    chain = [("tasks_video", "gpu"), ("tasks_video", "xnnpack"), ("solutions", "xnnpack")]
+    assert attempts == chain[:chain.index(expected) + 1]
+
+def test_open_backend_xnnpack_skips_straight_to_solutions(monkeypatch):
+    attempts = []
+    monkeypatch.setattr(backends, "create_backend", fake_create_backend({("solutions", "xnnpack")}, attempts))
+    backend = open_backend("tasks_live", dict(DEFAULT_OPTIONS, delegate="xnnpack"))
+
+    assert backend.name == "solutions"
+    assert attempts == [("tasks_live", "xnnpack"), ("solutions", "xnnpack")]
+
+def test_open_backend_raises_when_nothing_runs(monkeypatch, capsys):
+    attempts = []
+    monkeypatch.setattr(backends, "create_backend", fake_create_backend(set(), attempts))
+    with pytest.raises(RuntimeError, match="solutions"):
+        open_backend("tasks_video", dict(DEFAULT_OPTIONS, delegate="gpu"))
+    assert len(attempts) == 3
+    assert capsys.readouterr().out.count("[WARNING] Inference backend") == 3
+
+def test_tasks_backend_requires_model_file(tmp_path):
+    pytest.importorskip("mediapipe.tasks.python")
+    with pytest.raises(FileNotFoundError):
+        TasksBackend(dict(DEFAULT_OPTIONS, model_path=str(tmp_path / "missing.task")))
+
+def test_create_backend_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        backends.create_backend("nope", DEFAULT_OPTIONS)
@@ -0,0 +1,43 @@
+import numpy as np
+
+from tracking import FINGER_DOWN, HANDEDNESS_CHANGED, HandTracker
+
+
+def open_hand():
+    # wrist at the bottom, fingertips well above their joints so every finger reads as raised
+    landmarks = np.zeros((21, 3), dtype=np.float32)
+    landmarks[:, 0] = 0.5
+    landmarks[:, 1] = np.linspace(0.9, 0.3, 21)
+    return landmarks
+
+def frame(is_right):
+    return open_hand()[np.newaxis], np.array([is_right])
+
+
+def test_mislabelled_first_frame_does_not_pin_handedness():
+    tracker = HandTracker(handedness_frames=3)
+    tracker.update(*frame(False), 0.0)
+    changes = []
+    for i in range(1, 200):
+        changes += [event for event in tracker.update(*frame(True), i / 30) if event["type"] == HANDEDNESS_CHANGED]
+
+    track, = tracker.tracks
+    assert track.hand == "right" and track.is_right
+    assert track.track_id == 1
+    assert len(changes) == 1 and changes[0]["hand"] == "right"
+
+def test_single_disagreeing_frame_keeps_handedness():
+    tracker = HandTracker(handedness_frames=3)
+    for i, is_right in enumerate([True, True, False, True, False, False, True]):
+        tracker.update(*frame(is_right), i / 30)
+    assert tracker.tracks[0].hand == "right"
+
+def test_finger_events_use_updated_hand():
+    tracker = HandTracker(handedness_frames=2, debounce_frames=1)
+    tracker.update(*frame(False), 0.0)
+    tracker.update(*frame(True), 1 / 30)
+    tracker.update(*frame(True), 2 / 30)
+    closed = open_hand()
+    closed[8, 1] = 0.95
+    events = tracker.update(closed[np.newaxis], np.array([True]), 3 / 30)
+    assert [event["hand"] for event in events if event["type"] == FINGER_DOWN] == ["right"]
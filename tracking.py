@@ -0,0 +1,209 @@
+import math
+
+import numpy as np
+
+from landmarks import NUM_LANDMARKS, finger_states_batch
+
+FINGER_DOWN = "finger_down"
+FINGER_UP = "finger_up"
+COUNT_CHANGED = "count_changed"
+HAND_ENTERED = "hand_entered"
+HAND_LEFT = "hand_left"
+HANDEDNESS_CHANGED = "handedness_changed"
+
+# a detection with the other handedness can still continue a track, it just costs more
+HANDEDNESS_PENALTY = 0.1
+
+def smoothing_factor(dt, cutoff):
+    r = 2 * math.pi * cutoff * dt
+    return r / (r + 1)
+
+
+class OneEuroFilter:
+    def __init__(self, min_cutoff=1.0, beta=0.0, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.x = None
+        self.dx = None
+        self.t = None
+
+    def __call__(self, x, t):
+        if self.x is None:
+            self.x = np.array(x, dtype=np.float32)
+            self.dx = np.zeros_like(self.x)
+            self.t = t
+            return self.x
+        dt = t - self.t
+        if dt <= 0:
+            return self.x
+
+        a_d = smoothing_factor(dt, self.d_cutoff)
+        delta = x - self.x
+        self.dx *= 1 - a_d
+        self.dx += delta * (a_d / dt)
+        # fast movement raises the cutoff so the filter lags less, slow movement is smoothed harder
+        r = np.abs(self.dx)
+        r *= 2 * math.pi * dt * self.beta
+        r += 2 * math.pi * dt * self.min_cutoff
+        delta *= r / (r + 1)
+        self.x = self.x + delta
+        self.t = t
+        return self.x
+
+
+class HandTrack:
+    def __init__(self, track_id, is_right, landmarks, finger_states, smoothing):
+        self.track_id = track_id
+        self.is_right = bool(is_right)
+        self.hand = "right" if is_right else "left"
+        self.filter = OneEuroFilter(**smoothing) if smoothing else None
+        self.landmarks = landmarks
+        self.centre = landmarks[:, :2].sum(axis=0) / NUM_LANDMARKS
+        self.finger_states = finger_states.copy()
+        self.pending_frames = np.zeros(len(finger_states), dtype=np.int32)
+        self.handedness_pending = 0
+        self.missed = 0
+
+    @property
+    def count(self):
+        return int(self.finger_states.sum())
+
+
+class HandTracker:
+    def __init__(self, smoothing=None, debounce_frames=2, max_distance=0.2, max_missed=5, handedness_frames=3):
+        # smoothing: OneEuroFilter arguments, or None to use the raw landmarks
+        self.smoothing = smoothing
+        self.debounce_frames = max(1, debounce_frames)
+        self.handedness_frames = max(1, handedness_frames)
+        self.max_distance = max_distance
+        self.max_missed = max_missed
+        self.tracks = []
+        self._next_id = 1
+        self._subscribers = []
+
+    def subscribe(self, callback, event_types=None):
+        self._subscribers.append((callback, set(event_types) if event_types else None))
+
+    def reset(self):
+        self.tracks = []
+
+    def active_tracks(self):
+        return [track for track in self.tracks if track.missed == 0]
+
+    def update(self, landmarks, is_right, timestamp):
+        if not self.tracks and not len(landmarks):
+            return []
+        events = []
+        centres = landmarks[:, :, :2].sum(axis=1) / NUM_LANDMARKS
+        matches = self._associate(centres, is_right)
+        matched_tracks = set()
+        matched_detections = set()
+        updated = []
+        for track_idx, detection in matches:
+            track = self.tracks[track_idx]
+            track.missed = 0
+            self._debounce_handedness(track, bool(is_right[detection]), timestamp, events)
+            track.centre = centres[detection]
+            if track.filter is not None:
+                track.landmarks = track.filter(landmarks[detection], timestamp)
+            else:
+                track.landmarks = landmarks[detection]
+            matched_tracks.add(track_idx)
+            matched_detections.add(detection)
+            updated.append(track)
+
+        if updated:
+            # one batched call for every matched hand, using the debounced handedness of each track
+            raw_states = finger_states_batch(np.stack([track.landmarks for track in updated]),
+                                             np.array([track.is_right for track in updated]))
+            for track, states in zip(updated, raw_states):
+                self._debounce(track, states, timestamp, events)
+
+        for track_idx, track in enumerate(self.tracks):
+            if track_idx not in matched_tracks:
+                track.missed += 1
+                if track.missed > self.max_missed:
+                    events.append(self._event(HAND_LEFT, track, timestamp))
+
+        self.tracks = [track for track in self.tracks if track.missed <= self.max_missed]
+
+        if len(matched_detections) < len(landmarks):
+            new = [detection for detection in range(len(landmarks)) if detection not in matched_detections]
+            new_states = finger_states_batch(landmarks[new], is_right[new])
+            for detection, states in zip(new, new_states):
+                track = HandTrack(self._next_id, is_right[detection], landmarks[detection], states, self.smoothing)
+                if track.filter is not None:
+                    track.filter(landmarks[detection], timestamp)
+                self._next_id += 1
+                self.tracks.append(track)
+                event = self._event(HAND_ENTERED, track, timestamp)
+                event["count"] = track.count
+                events.append(event)
+
+        for event in events:
+            for callback, event_types in self._subscribers:
+                if event_types is None or event["type"] in event_types:
+                    callback(event)
+        return events
+
+    def _associate(self, centres, is_right):
+        if not self.tracks or not len(centres):
+            return []
+        # greedy matching on palm centres is enough for the handful of hands in view
+        track_centres = np.array([track.centre for track in self.tracks])
+        offsets = track_centres[:, np.newaxis] - centres[np.newaxis]
+        cost = np.sqrt((offsets ** 2).sum(axis=2))
+        track_right = np.array([track.is_right for track in self.tracks])
+        cost += HANDEDNESS_PENALTY * (track_right[:, np.newaxis] != is_right[np.newaxis])
+        # tracks that were just seen win ties against ones about to expire
+        cost += 0.01 * np.array([track.missed for track in self.tracks])[:, np.newaxis]
+
+        matches = []
+        for flat in np.argsort(cost, axis=None).tolist():
+            track_idx, detection = divmod(flat, cost.shape[1])
+            if cost[track_idx, detection] > self.max_distance:
+                break
+            if any(track_idx == t or detection == d for t, d in matches):
+                continue
+            matches.append((track_idx, detection))
+        return matches
+
+    def _debounce_handedness(self, track, is_right, timestamp, events):
+        # one mislabelled frame as the hand enters must not pin the wrong hand for the whole track
+        if is_right == track.is_right:
+            track.handedness_pending = 0
+            return
+        track.handedness_pending += 1
+        if track.handedness_pending < self.handedness_frames:
+            return
+        track.is_right = is_right
+        track.hand = "right" if is_right else "left"
+        track.handedness_pending = 0
+        events.append(self._event(HANDEDNESS_CHANGED, track, timestamp))
+
+    def _debounce(self, track, states, timestamp, events):
+        # a finger only changes state after disagreeing for debounce_frames frames in a row
+        changed = states != track.finger_states
+        if not changed.any() and not track.pending_frames.any():
+            return
+        track.pending_frames[changed] += 1
+        track.pending_frames[~changed] = 0
+        flips = np.flatnonzero(track.pending_frames >= self.debounce_frames)
+        if not len(flips):
+            return
+        previous = track.count
+        for finger in flips.tolist():
+            track.finger_states[finger] = states[finger]
+            event = self._event(FINGER_UP if states[finger] else FINGER_DOWN, track, timestamp)
+            event["finger"] = finger
+            events.append(event)
+        track.pending_frames[flips] = 0
+        if track.count != previous:
+            event = self._event(COUNT_CHANGED, track, timestamp)
+            event["count"] = track.count
+            event["previous"] = previous
+            events.append(event)
+
+    def _event(self, event_type, track, timestamp):
+        return {"type": event_type, "hand_id": track.track_id, "hand": track.hand, "timestamp": timestamp}